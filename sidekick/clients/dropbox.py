@@ -9,6 +9,36 @@ import re
 from typing import Optional, Union
 
 
+# Title div that Paper HTML exports prepend to the body (matched on UTF-8 bytes)
+_PAPER_TITLE_DIV_RE = re.compile(rb'<div[^>]*font-size:\s*40px[^>]*>.*?</div>', re.DOTALL)
+
+# Paper share links: paper.dropbox.com URLs or *.paper file links (case-insensitive)
+_PAPER_LINK_RE = re.compile(r'paper\.dropbox\.com|\.paper', re.IGNORECASE)
+
+# Characters that json.dumps would escape inside an ASCII string
+_JSON_ESCAPE_RE = re.compile(r'["\\\x00-\x1f]')
+
+
+def _encode_api_arg(api_arg: dict) -> str:
+    """Encode a Dropbox-API-Arg header value.
+
+    Most content requests send only {"path": ...}, so plain ASCII paths are
+    formatted directly instead of going through json.dumps. The output is
+    identical to json.dumps(api_arg).
+
+    Args:
+        api_arg: JSON-serializable API argument dict
+
+    Returns:
+        str with JSON-encoded header value
+    """
+    if len(api_arg) == 1:
+        path = api_arg.get("path")
+        if isinstance(path, str) and path.isascii() and not _JSON_ESCAPE_RE.search(path):
+            return '{"path": "' + path + '"}'
+    return json.dumps(api_arg)
+
+
 class DropboxClient:
     """Client for Dropbox API v2.
 
@@ -224,7 +254,7 @@ class DropboxClient:
 
         headers = {
             "Authorization": f"Bearer {self._get_access_token()}",
-            "Dropbox-API-Arg": json.dumps(api_arg)
+            "Dropbox-API-Arg": _encode_api_arg(api_arg)
         }
 
         if upload_content is not None:
@@ -290,8 +320,7 @@ class DropboxClient:
         Returns:
             True if Paper doc link, False otherwise
         """
-        link_lower = link.lower()
-        return 'paper.dropbox.com' in link_lower or '.paper' in link_lower
+        return _PAPER_LINK_RE.search(link) is not None
 
     def _is_paper_file(self, metadata: dict) -> bool:
         """Check if file metadata indicates a Paper doc.
@@ -368,7 +397,7 @@ class DropboxClient:
             url = "https://content.dropboxapi.com/2/files/export"
             headers = {
                 "Authorization": f"Bearer {self._get_access_token()}",
-                "Dropbox-API-Arg": json.dumps(api_arg)
+                "Dropbox-API-Arg": _encode_api_arg(api_arg)
             }
 
             req = urllib.request.Request(url, headers=headers, method='POST')
@@ -587,26 +616,20 @@ class DropboxClient:
             # For other errors, let them propagate during the actual update call
             pass
 
-        # Convert bytes to str if needed for processing
-        if isinstance(content, bytes):
-            content_str = content.decode('utf-8')
+        # Work on UTF-8 bytes throughout so bytes input is never decoded and re-encoded
+        if isinstance(content, str):
+            content_bytes = content.encode('utf-8')
         else:
-            content_str = content
+            content_bytes = content
 
         # For HTML format, strip out the title div (40px font-size)
         # Paper API will use the document's own title, so we don't want it duplicated in the body
         if import_format == 'html':
             # Remove the first div with font-size: 40px (the title)
-            content_str = re.sub(
-                r'<div[^>]*font-size:\s*40px[^>]*>.*?</div>',
-                '',
-                content_str,
-                count=1,
-                flags=re.DOTALL
-            )
+            content_bytes = _PAPER_TITLE_DIV_RE.sub(b'', content_bytes, count=1)
 
-        # Convert to bytes for sending
-        content_bytes = content_str.encode('utf-8')
+        # Send through a memoryview so urllib hands the buffer to the socket without copying
+        body = memoryview(content_bytes)
 
         # Prepare API arg for Dropbox-API-Arg header
         api_arg = {
@@ -619,10 +642,11 @@ class DropboxClient:
         headers = {
             "Authorization": f"Bearer {self._get_access_token()}",
             "Dropbox-API-Arg": json.dumps(api_arg),
-            "Content-Type": "application/octet-stream"
+            "Content-Type": "application/octet-stream",
+            "Content-Length": str(body.nbytes)
         }
 
-        req = urllib.request.Request(url, data=content_bytes, headers=headers, method='POST')
+        req = urllib.request.Request(url, data=body, headers=headers, method='POST')
 
         try:
             with urllib.request.urlopen(req, timeout=self.timeout) as response:
@@ -642,7 +666,7 @@ class DropboxClient:
                 self.access_token = None  # Force token refresh
                 # Retry the update request
                 headers["Authorization"] = f"Bearer {self._get_access_token()}"
-                req = urllib.request.Request(url, data=content_bytes, headers=headers, method='POST')
+                req = urllib.request.Request(url, data=body, headers=headers, method='POST')
                 try:
                     with urllib.request.urlopen(req, timeout=self.timeout) as response:
                         response_body = response.read().decode('utf-8')
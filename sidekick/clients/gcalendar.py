@@ -1,15 +1,29 @@
 """Google Calendar API Client - single file implementation with CLI support."""
 
 import argparse
+import functools
+import gzip
+import hashlib
+import http.client
+import itertools
+import os
+import random
 import sys
 import json
 import re
-import urllib.request
+import threading
+import time
 import urllib.parse
-import urllib.error
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional, List
+from pathlib import Path
+from typing import Iterator, Optional, List
+
+try:
+    from sidekick.config import get_google_config
+except ImportError:
+    get_google_config = None
 
 
 DEFAULT_AUDIT_INSTANCES = 4
@@ -18,14 +32,49 @@ DEFAULT_AUDIT_MIN_INSTANCES = 4
 DEFAULT_AUDIT_LOOKBACK_DAYS = 180
 DEFAULT_AUDIT_LOOKAHEAD_DAYS = 180
 DEFAULT_AUDIT_SEND_UPDATES = "all"
+DEFAULT_MAX_WORKERS = 8
+# Idle keep-alive connections kept per host between requests
+MAX_IDLE_CONNECTIONS = DEFAULT_MAX_WORKERS
 RSVP_STATUSES = {"accepted", "declined", "tentative", "needsAction"}
 SPLIT_RECURRING_SERIES_RE = re.compile(r"^(.+)_R\d{8}T\d{6}$")
+TOKEN_CACHE_PATH = Path.home() / ".cache" / "sidekick" / "gcal_token.json"
+# Access tokens are refreshed (and cached ones ignored) this long before
+# they expire, so requests never go out with a token about to lapse
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "PUT", "DELETE"}
+MAX_RETRIES = 5
+RETRY_BASE_DELAY_SECONDS = 0.5
+RETRY_MAX_DELAY_SECONDS = 10.0
+BATCH_URL = "https://www.googleapis.com/batch/calendar/v3"
+MAX_BATCH_SIZE = 50
+MAX_PAGE_SIZE = 2500
+BATCH_BOUNDARY = "batch_sidekick_gcalendar"
+BATCH_CONTENT_ID_RE = re.compile(r"^Content-ID:\s*<response-item-(\d+)>", re.IGNORECASE | re.MULTILINE)
+BATCH_BOUNDARY_RE = re.compile(r'boundary="?([^";]+)"?')
+# Google only gzips responses when the User-Agent also mentions gzip
+COMPRESSION_HEADERS = {"Accept-Encoding": "gzip", "User-Agent": "sidekick-gcalendar/1.0 (gzip)"}
+# Shared compact encoder for request bodies; json.dumps would build a new
+# encoder on every call once non-default options are passed
+_JSON_BODY_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
 
 
 class GCalendarClient:
     """Google Calendar API client using native Python stdlib."""
 
-    def __init__(self, client_id: str, client_secret: str, refresh_token: str, timeout: int = 30):
+    API_ORIGIN = "https://www.googleapis.com"
+    API_BASE_URL = API_ORIGIN + "/calendar/v3"
+    EVENTS_URL = API_BASE_URL + "/calendars/{cid}/events"
+    EVENT_URL = EVENTS_URL + "/{eid}"
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        refresh_token: str,
+        timeout: int = 30,
+        token_cache_path: Optional[Path] = TOKEN_CACHE_PATH
+    ):
         """Initialize Google Calendar client with OAuth2 credentials.
 
         Args:
@@ -33,13 +82,132 @@ class GCalendarClient:
             client_secret: OAuth2 client secret
             refresh_token: OAuth2 refresh token
             timeout: Request timeout in seconds
+            token_cache_path: File used to reuse access tokens across
+                processes (None disables the disk cache)
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.refresh_token = refresh_token
         self.timeout = timeout
+        self.token_cache_path = Path(token_cache_path) if token_cache_path else None
         self.access_token = None
+        self.access_token_expires_at = 0.0
+        # JSON request headers for the current access token, rebuilt on refresh
+        self._base_headers = None
         self.api_call_count = 0
+        self._count_lock = threading.Lock()
+        # Idle keep-alive HTTPS connections keyed by host. Each request checks
+        # one out and returns it afterwards, so concurrent callers never share
+        # a socket and connections outlive the worker threads that used them
+        self._idle_connections = {}
+        self._connections_lock = threading.Lock()
+        self._token_lock = threading.Lock()
+
+    def _checkout_connection(self, host: str) -> tuple:
+        """Take an idle keep-alive connection for a host, or open a new one.
+
+        Returns:
+            tuple of (connection: HTTPSConnection, reused: bool)
+        """
+        with self._connections_lock:
+            idle = self._idle_connections.get(host)
+            if idle:
+                return idle.pop(), True
+        return http.client.HTTPSConnection(host, timeout=self.timeout), False
+
+    def _return_connection(self, host: str, conn: http.client.HTTPSConnection) -> None:
+        """Put a connection back in the idle pool, closing it if the pool is full."""
+        with self._connections_lock:
+            idle = self._idle_connections.setdefault(host, [])
+            if len(idle) < MAX_IDLE_CONNECTIONS:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close all idle keep-alive connections."""
+        with self._connections_lock:
+            idle, self._idle_connections = self._idle_connections, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[dict] = None
+    ) -> tuple:
+        """Send an HTTP request over a reused keep-alive connection.
+
+        A connection that the server closed while idle is reopened and the
+        request is sent once more; any other failure is not retried.
+
+        Returns:
+            tuple of (status: int, headers: HTTPMessage, body: bytes)
+
+        Raises:
+            ConnectionError: For network errors
+        """
+        parts = urllib.parse.urlsplit(url)
+        path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        host = parts.netloc
+
+        for attempt in range(2):
+            conn, reused = self._checkout_connection(host)
+            try:
+                conn.request(method, path, body=body, headers=headers or {})
+                response = conn.getresponse()
+                raw = response.read()
+                if response.headers.get("Content-Encoding") == "gzip":
+                    raw = gzip.decompress(raw)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise ConnectionError(f"Network error: {e}")
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                raise ConnectionError(f"Network error: {e}")
+            self._return_connection(host, conn)
+            return response.status, response.headers, raw
+
+    def _send_with_backoff(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[dict] = None
+    ) -> tuple:
+        """Send a request, retrying transient failures with exponential backoff.
+
+        5xx responses and network errors are retried only for idempotent
+        methods, since a POST or PATCH may already have applied; those are
+        retried only on 429, or on 503 when the server sends Retry-After.
+        A Retry-After header, when present, sets the delay.
+
+        Returns:
+            tuple of (status: int, headers: HTTPMessage, body: bytes) from the
+            last attempt
+
+        Raises:
+            ConnectionError: For network errors after the last attempt
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            last_attempt = attempt == MAX_RETRIES
+            try:
+                status, response_headers, raw = self._send(method, url, body=body, headers=headers)
+            except ConnectionError:
+                if last_attempt or method not in IDEMPOTENT_METHODS:
+                    raise
+                delay = _backoff_delay(attempt)
+            else:
+                retry_after = _parse_retry_after(response_headers.get("Retry-After"))
+                if last_attempt or not _is_retryable_status(method, status, retry_after):
+                    return status, response_headers, raw
+                delay = retry_after if retry_after is not None else _backoff_delay(attempt)
+            time.sleep(delay)
 
     def _refresh_access_token(self) -> str:
         """Refresh OAuth2 access token using refresh token.
@@ -59,98 +227,233 @@ class GCalendarClient:
         }
 
         encoded_data = urllib.parse.urlencode(data).encode()
-        req = urllib.request.Request(token_url, data=encoded_data, method="POST")
-        req.add_header("Content-Type", "application/x-www-form-urlencoded")
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
+        status, _, body = self._send("POST", token_url, body=encoded_data, headers=headers)
+        if status >= 400:
+            raise ValueError(f"Failed to refresh access token: {status} - {body.decode()}")
         try:
-            with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                result = json.loads(response.read().decode())
-                return result["access_token"]
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode() if e.fp else ""
-            raise ValueError(f"Failed to refresh access token: {e.code} - {error_body}")
+            result = json.loads(body)
+            access_token = result["access_token"]
         except (KeyError, json.JSONDecodeError) as e:
             raise ValueError(f"Invalid token response: {e}")
 
+        self.access_token_expires_at = time.time() + result.get("expires_in", 3600)
+        self._save_cached_token(access_token, self.access_token_expires_at)
+        return access_token
+
+    def _token_cache_key(self) -> str:
+        """Identify cached tokens by refresh token without storing it in the clear."""
+        return hashlib.sha256((self.refresh_token or "").encode()).hexdigest()[:16]
+
+    def _load_cached_token(self) -> Optional[str]:
+        """Load an access token from the disk cache if it is not about to expire."""
+        if not self.token_cache_path:
+            return None
+        try:
+            cached = json.loads(self.token_cache_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if cached.get("client_id") != self.client_id or cached.get("key") != self._token_cache_key():
+            return None
+        if cached.get("expires_at", 0) - TOKEN_EXPIRY_MARGIN_SECONDS <= time.time():
+            return None
+        self.access_token_expires_at = cached["expires_at"]
+        return cached.get("access_token")
+
+    def _save_cached_token(self, access_token: str, expires_at: float) -> None:
+        """Atomically write the access token to the disk cache (owner read/write only)."""
+        if not self.token_cache_path:
+            return
+        tmp_path = self.token_cache_path.with_name(f"{self.token_cache_path.name}.{os.getpid()}.tmp")
+        try:
+            self.token_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump({
+                    "client_id": self.client_id,
+                    "key": self._token_cache_key(),
+                    "access_token": access_token,
+                    "expires_at": expires_at,
+                }, f)
+            os.replace(tmp_path, self.token_cache_path)
+        except OSError:
+            # The cache is an optimization; a failed write just means a refresh next time
+            pass
+
+    def invalidate_token(self) -> None:
+        """Forget the current access token in memory and on disk."""
+        with self._token_lock:
+            self.access_token = None
+            self.access_token_expires_at = 0.0
+            self._base_headers = None
+        if self.token_cache_path:
+            try:
+                self.token_cache_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _token_is_fresh(self) -> bool:
+        """Whether the in-memory token is set and not close to expiring."""
+        return bool(self.access_token) and time.time() < self.access_token_expires_at - TOKEN_EXPIRY_MARGIN_SECONDS
+
     def _get_access_token(self) -> str:
         """Get valid access token, refreshing if necessary."""
-        if not self.access_token:
-            self.access_token = self._refresh_access_token()
-        return self.access_token
+        with self._token_lock:
+            self._ensure_fresh_token()
+            return self.access_token
+
+    def _ensure_fresh_token(self) -> None:
+        """Load or refresh the access token if needed; callers hold _token_lock.
+
+        Concurrent callers share a single refresh, and nobody reads the token
+        or its headers while invalidate_token is clearing them.
+        """
+        if not self._token_is_fresh():
+            self.access_token = self._load_cached_token() or self._refresh_access_token()
+            self._base_headers = {
+                "Authorization": f"Bearer {self.access_token}",
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                **COMPRESSION_HEADERS
+            }
+
+    def _get_base_headers(self) -> dict:
+        """Get the shared JSON request headers for a valid access token.
+
+        The dict is reused across requests and must not be mutated.
+        """
+        with self._token_lock:
+            self._ensure_fresh_token()
+            return self._base_headers
+
+    def _count_api_call(self) -> None:
+        """Increment api_call_count; requests may run on worker threads."""
+        with self._count_lock:
+            self.api_call_count += 1
 
     def _request(
         self,
         method: str,
-        endpoint: str,
+        url: str,
         params: Optional[dict] = None,
         json_data: Optional[dict] = None,
         retry_auth: bool = True
-    ) -> Optional[dict]:
+    ) -> dict:
         """Make HTTP request to Google Calendar API.
 
         Args:
             method: HTTP method (GET, POST, PUT, PATCH, DELETE)
-            endpoint: API endpoint path
+            url: Full API URL (see EVENTS_URL / EVENT_URL)
             params: URL query parameters
             json_data: JSON body data
             retry_auth: Whether to retry once on auth failure
 
         Returns:
-            Parsed JSON response as dict, or None for DELETE
+            Parsed JSON response as dict ({} for empty bodies such as DELETE)
 
         Raises:
             ConnectionError: For network errors
             ValueError: For 4xx client errors
             RuntimeError: For 5xx server errors
         """
-        # Build URL
-        base_url = "https://www.googleapis.com/calendar/v3"
-        url = f"{base_url}{endpoint}"
-        if params:
-            url += "?" + urllib.parse.urlencode(params)
+        request_url = f"{url}?{urllib.parse.urlencode(params)}" if params else url
+
+        data = _encode_json_body(json_data) if json_data else None
+        status, _, raw = self._send_with_backoff(method, request_url, body=data, headers=self._get_base_headers())
+
+        if status < 300:
+            self._count_api_call()
+            # json.loads accepts UTF-8 bytes directly, so skip building a str copy
+            if not raw or raw.isspace():
+                return {}
+            return json.loads(raw)
+
+        error_body = raw.decode()
+
+        # Retry once on 401 (token might be expired)
+        if status == 401 and retry_auth:
+            self.invalidate_token()  # Force token refresh
+            return self._request(method, url, params, json_data, retry_auth=False)
+
+        self._raise_for_status(status, url, error_body)
+
+    def _raise_for_status(self, status: int, url: str, error_body: str) -> None:
+        """Raise the client's standard exception for an HTTP error status."""
+        if status == 404:
+            raise ValueError(f"Resource not found: {url}")
+        elif status >= 400 and status < 500:
+            raise ValueError(f"Client error {status}: {error_body}")
+        elif status >= 500:
+            raise RuntimeError(f"Server error {status}: {error_body}")
+        else:
+            raise ConnectionError(f"HTTP error {status}: {error_body}")
 
-        # Prepare request
-        headers = {
-            "Authorization": f"Bearer {self._get_access_token()}",
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
-        data = json.dumps(json_data).encode() if json_data else None
-        req = urllib.request.Request(url, data=data, headers=headers, method=method)
+    def _batch_request(self, requests: List[tuple]) -> List[dict]:
+        """Send many Calendar API calls through the batch endpoint.
 
-        try:
-            with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                self.api_call_count += 1
-                body = response.read().decode()
-                if not body or body.strip() == "":
-                    return None
-                return json.loads(body)
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode() if e.fp else ""
-
-            # Retry once on 401 (token might be expired)
-            if e.code == 401 and retry_auth:
-                self.access_token = None  # Force token refresh
-                return self._request(method, endpoint, params, json_data, retry_auth=False)
-
-            # Handle 204 No Content (success for DELETE)
-            if e.code == 204:
-                return None
-
-            if e.code == 404:
-                raise ValueError(f"Resource not found: {endpoint}")
-            elif e.code >= 400 and e.code < 500:
-                raise ValueError(f"Client error {e.code}: {error_body}")
-            elif e.code >= 500:
-                raise RuntimeError(f"Server error {e.code}: {error_body}")
+        Calls are packed into multipart/mixed requests of up to 50 parts,
+        so N operations cost ceil(N / 50) round-trips.
+
+        Args:
+            requests: List of (method, url, params, json_data) tuples
+
+        Returns:
+            List of response dicts in request order. Successful parts return
+            the parsed body ({} when empty); failed parts return Google's
+            error body, which has an "error" key.
+        """
+        results = []
+        for start in range(0, len(requests), MAX_BATCH_SIZE):
+            results.extend(self._send_batch(requests[start:start + MAX_BATCH_SIZE]))
+        return results
+
+    def _send_batch(self, requests: List[tuple], retry_auth: bool = True) -> List[dict]:
+        """Send one multipart batch request (at most MAX_BATCH_SIZE parts)."""
+        parts = []
+        for index, (method, url, params, json_data) in enumerate(requests):
+            path = url[len(self.API_ORIGIN):]
+            if params:
+                path += "?" + urllib.parse.urlencode(params)
+            part = (
+                f"--{BATCH_BOUNDARY}\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <item-{index}>\r\n\r\n"
+                f"{method} {path} HTTP/1.1\r\n"
+            )
+            if json_data is not None:
+                part += f"Content-Type: application/json\r\n\r\n{_JSON_BODY_ENCODER.encode(json_data)}\r\n"
             else:
-                raise ConnectionError(f"HTTP error {e.code}: {error_body}")
-        except urllib.error.URLError as e:
-            raise ConnectionError(f"Network error: {e.reason}")
+                part += "\r\n"
+            parts.append(part)
+        body = ("".join(parts) + f"--{BATCH_BOUNDARY}--\r\n").encode()
 
-    def _calendar_endpoint(self, calendar_id: str, suffix: str) -> str:
-        """Build a URL-safe Calendar API endpoint for a calendar."""
-        return f"/calendars/{urllib.parse.quote(calendar_id, safe='')}{suffix}"
+        headers = {
+            "Authorization": f"Bearer {self._get_access_token()}",
+            "Content-Type": f"multipart/mixed; boundary={BATCH_BOUNDARY}",
+            **COMPRESSION_HEADERS
+        }
+        status, response_headers, raw = self._send_with_backoff("POST", BATCH_URL, body=body, headers=headers)
+
+        if status == 401 and retry_auth:
+            self.invalidate_token()  # Force token refresh
+            return self._send_batch(requests, retry_auth=False)
+        if status >= 300:
+            self._raise_for_status(status, BATCH_URL, raw.decode())
+
+        self._count_api_call()
+        return _parse_batch_response(response_headers.get("Content-Type", ""), raw, len(requests))
+
+    def _events_url(self, calendar_id: str) -> str:
+        """Build the URL-safe events collection URL for a calendar."""
+        return self.EVENTS_URL.format(cid=urllib.parse.quote(calendar_id, safe=''))
+
+    def _event_url(self, calendar_id: str, event_id: str) -> str:
+        """Build the URL-safe URL for one event."""
+        return self.EVENT_URL.format(
+            cid=urllib.parse.quote(calendar_id, safe=''),
+            eid=urllib.parse.quote(event_id, safe='')
+        )
 
     def list_events(
         self,
@@ -172,19 +475,11 @@ class GCalendarClient:
         Returns:
             List of event dicts
         """
-        params = {
-            "maxResults": max_results,
-            "singleEvents": "true",  # Expand recurring events
-            "orderBy": order_by
-        }
-
-        if time_min:
-            params["timeMin"] = time_min
-        if time_max:
-            params["timeMax"] = time_max
-
-        result = self._request("GET", f"/calendars/{calendar_id}/events", params=params)
-        return result.get("items", []) if result else []
+        page_size = min(max_results, MAX_PAGE_SIZE)
+        return list(itertools.islice(
+            self.iter_events(calendar_id, time_min, time_max, page_size, order_by),
+            max_results
+        ))
 
     def list_events_paginated(
         self,
@@ -196,34 +491,49 @@ class GCalendarClient:
         single_events: bool = True
     ) -> List[dict]:
         """List all calendar events in a range, following nextPageToken pages."""
-        params = {
-            "maxResults": max_results,
-            "orderBy": order_by
-        }
+        return list(self.iter_events(calendar_id, time_min, time_max, max_results, order_by, single_events))
+
+    def iter_events(
+        self,
+        calendar_id: str = "primary",
+        time_min: Optional[str] = None,
+        time_max: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        order_by: str = "startTime",
+        single_events: bool = True
+    ) -> Iterator[dict]:
+        """Yield calendar events in a range, fetching nextPageToken pages lazily.
+
+        Args:
+            calendar_id: Calendar ID (default: "primary" for main calendar)
+            time_min: Start time (RFC3339 timestamp)
+            time_max: End time (RFC3339 timestamp)
+            page_size: Events requested per page (API maximum is 2500)
+            order_by: Order results by "startTime" or "updated"
+            single_events: Expand recurring events into instances
+
+        Yields:
+            Event dicts
+        """
+        # Build the query once: the values are integers, fixed keywords, and
+        # RFC3339 timestamps, so generic urlencode is unnecessary
+        query = f"maxResults={int(page_size)}&orderBy={urllib.parse.quote(order_by)}"
         if single_events:
-            params["singleEvents"] = "true"
+            query += "&singleEvents=true"
         if time_min:
-            params["timeMin"] = time_min
+            query += f"&timeMin={urllib.parse.quote(time_min, safe=':')}"
         if time_max:
-            params["timeMax"] = time_max
+            query += f"&timeMax={urllib.parse.quote(time_max, safe=':')}"
+        url = f"{self._events_url(calendar_id)}?{query}"
 
-        events = []
-        page_token = None
+        page_url = url
         while True:
-            if page_token:
-                params["pageToken"] = page_token
-            else:
-                params.pop("pageToken", None)
-
-            result = self._request("GET", self._calendar_endpoint(calendar_id, "/events"), params=params)
-            if not result:
-                break
-            events.extend(result.get("items", []))
+            result = self._request("GET", page_url)
+            yield from result.get("items", [])
             page_token = result.get("nextPageToken")
             if not page_token:
-                break
-
-        return events
+                return
+            page_url = f"{url}&pageToken={urllib.parse.quote(page_token, safe='')}"
 
     def list_event_instances(
         self,
@@ -244,7 +554,6 @@ class GCalendarClient:
 
         events = []
         page_token = None
-        event_path = urllib.parse.quote(event_id, safe="")
         while True:
             if page_token:
                 params["pageToken"] = page_token
@@ -253,11 +562,9 @@ class GCalendarClient:
 
             result = self._request(
                 "GET",
-                self._calendar_endpoint(calendar_id, f"/events/{event_path}/instances"),
+                f"{self._event_url(calendar_id, event_id)}/instances",
                 params=params
             )
-            if not result:
-                break
             events.extend(result.get("items", []))
             if max_items and len(events) >= max_items:
                 return events[:max_items]
@@ -279,7 +586,7 @@ class GCalendarClient:
         """
         return self._request(
             "GET",
-            self._calendar_endpoint(calendar_id, f"/events/{urllib.parse.quote(event_id, safe='')}")
+            self._event_url(calendar_id, event_id)
         )
 
     def patch_event(
@@ -293,7 +600,7 @@ class GCalendarClient:
         params = {"sendUpdates": send_updates}
         return self._request(
             "PATCH",
-            self._calendar_endpoint(calendar_id, f"/events/{urllib.parse.quote(event_id, safe='')}"),
+            self._event_url(calendar_id, event_id),
             params=params,
             json_data=patch_data or {}
         )
@@ -324,31 +631,29 @@ class GCalendarClient:
         Returns:
             Created event dict
         """
-        event_data = {
-            "summary": summary,
-            "start": {},
-            "end": {}
-        }
-
         # Determine if all-day event (date only) or timed event (datetime)
-        if "T" in start_time:
-            event_data["start"]["dateTime"] = start_time
-            event_data["start"]["timeZone"] = tz
-            event_data["end"]["dateTime"] = end_time
-            event_data["end"]["timeZone"] = tz
+        if _is_timed(start_time):
+            event_data = {
+                "summary": summary,
+                "start": {"dateTime": start_time, "timeZone": tz},
+                "end": {"dateTime": end_time, "timeZone": tz}
+            }
         else:
             # All-day event
-            event_data["start"]["date"] = start_time
-            event_data["end"]["date"] = end_time
+            event_data = {
+                "summary": summary,
+                "start": {"date": start_time},
+                "end": {"date": end_time}
+            }
 
         if description:
             event_data["description"] = description
         if location:
             event_data["location"] = location
         if attendees:
-            event_data["attendees"] = [{"email": email} for email in attendees]
+            event_data["attendees"] = list(map(_attendee, attendees))
 
-        return self._request("POST", f"/calendars/{calendar_id}/events", json_data=event_data)
+        return self._request("POST", self._events_url(calendar_id), json_data=event_data)
 
     def update_event(
         self,
@@ -378,32 +683,27 @@ class GCalendarClient:
         Returns:
             Updated event dict
         """
-        # Get existing event first
-        event = self.get_event(event_id, calendar_id)
-
-        # Update fields
+        # PATCH only the fields being changed, so no read-modify-write GET is needed
+        patch = {}
         if summary is not None:
-            event["summary"] = summary
+            patch["summary"] = summary
         if description is not None:
-            event["description"] = description
+            patch["description"] = description
         if location is not None:
-            event["location"] = location
+            patch["location"] = location
         if attendees is not None:
-            event["attendees"] = [{"email": email} for email in attendees]
+            patch["attendees"] = list(map(_attendee, attendees))
 
         if start_time is not None:
-            if "T" in start_time:
-                event["start"] = {"dateTime": start_time, "timeZone": tz}
-            else:
-                event["start"] = {"date": start_time}
-
+            patch["start"] = _event_time_patch(start_time, tz)
         if end_time is not None:
-            if "T" in end_time:
-                event["end"] = {"dateTime": end_time, "timeZone": tz}
-            else:
-                event["end"] = {"date": end_time}
+            patch["end"] = _event_time_patch(end_time, tz)
 
-        return self._request("PUT", f"/calendars/{calendar_id}/events/{event_id}", json_data=event)
+        return self._request(
+            "PATCH",
+            self._event_url(calendar_id, event_id),
+            json_data=patch
+        )
 
     def delete_event(
         self,
@@ -419,7 +719,7 @@ class GCalendarClient:
             send_updates: Whether to send notifications ("all", "externalOnly", "none")
         """
         params = {"sendUpdates": send_updates}
-        self._request("DELETE", f"/calendars/{calendar_id}/events/{event_id}", params=params)
+        self._request("DELETE", self._event_url(calendar_id, event_id), params=params)
 
     def respond_to_event(
         self,
@@ -466,7 +766,74 @@ class GCalendarClient:
         # Using PATCH instead of PUT to avoid overwriting other fields
         patch_data = {"attendees": event["attendees"]}
         params = {"sendUpdates": send_updates}
-        return self._request("PATCH", f"/calendars/{calendar_id}/events/{event_id}", params=params, json_data=patch_data)
+        return self._request("PATCH", self._event_url(calendar_id, event_id), params=params, json_data=patch_data)
+
+    def batch_create_events(self, events: List[dict], calendar_id: str = "primary") -> List[dict]:
+        """Create many events using the batch endpoint.
+
+        Args:
+            events: Event bodies in Calendar API format
+            calendar_id: Calendar ID (default: "primary")
+
+        Returns:
+            List of created event dicts (or error dicts) in input order
+        """
+        url = self._events_url(calendar_id)
+        return self._batch_request([("POST", url, None, event) for event in events])
+
+    def batch_patch_events(
+        self,
+        patches: List[tuple],
+        calendar_id: str = "primary",
+        send_updates: str = "all"
+    ) -> List[dict]:
+        """Patch many events using the batch endpoint.
+
+        Args:
+            patches: List of (event_id, patch_data) tuples
+            calendar_id: Calendar ID (default: "primary")
+            send_updates: Whether to send notifications ("all", "externalOnly", "none")
+
+        Returns:
+            List of updated event dicts (or error dicts) in input order
+        """
+        params = {"sendUpdates": send_updates}
+        return self._batch_request([
+            (
+                "PATCH",
+                self._event_url(calendar_id, event_id),
+                params,
+                patch_data
+            )
+            for event_id, patch_data in patches
+        ])
+
+    def batch_delete_events(
+        self,
+        event_ids: List[str],
+        calendar_id: str = "primary",
+        send_updates: str = "all"
+    ) -> List[dict]:
+        """Delete many events using the batch endpoint.
+
+        Args:
+            event_ids: Event IDs to delete
+            calendar_id: Calendar ID (default: "primary")
+            send_updates: Whether to send notifications ("all", "externalOnly", "none")
+
+        Returns:
+            List of result dicts in input order ({} on success, error dict otherwise)
+        """
+        params = {"sendUpdates": send_updates}
+        return self._batch_request([
+            (
+                "DELETE",
+                self._event_url(calendar_id, event_id),
+                params,
+                None
+            )
+            for event_id in event_ids
+        ])
 
     def decline_event(
         self,
@@ -489,6 +856,84 @@ class GCalendarClient:
         return self.respond_to_event(event_id, "declined", calendar_id, message, send_updates)
 
 
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff delay with jitter for a zero-based retry attempt."""
+    return min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * 2 ** attempt) + random.uniform(0, 1)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def _is_retryable_status(method: str, status: int, retry_after: Optional[float]) -> bool:
+    """Check whether a response status may be retried for this method."""
+    if status not in RETRY_STATUSES:
+        return False
+    if method in IDEMPOTENT_METHODS or status == 429:
+        return True
+    return status == 503 and retry_after is not None
+
+
+def _attendee(email: str) -> dict:
+    """Build an attendee entry for an event body."""
+    return {"email": email}
+
+
+def _is_timed(value: str) -> bool:
+    """Check for an RFC3339 date-time (vs a bare date) via its fixed 'T' position."""
+    return len(value) > 10 and value[10] == "T"
+
+
+def _event_time_patch(value: str, tz: str) -> dict:
+    """Build a start/end PATCH object for a date-time or an all-day date.
+
+    PATCH merges nested objects, so the other form's keys are sent as null
+    to clear them when an event switches between timed and all-day.
+    """
+    if _is_timed(value):
+        return {"date": None, "dateTime": value, "timeZone": tz}
+    return {"date": value, "dateTime": None, "timeZone": None}
+
+
+def _encode_json_body(data) -> bytes:
+    """Encode a request body as compact UTF-8 JSON."""
+    return _JSON_BODY_ENCODER.encode(data).encode("utf-8")
+
+
+def _parse_batch_response(content_type: str, raw: bytes, count: int) -> List[dict]:
+    """Split a multipart/mixed batch response into per-request result dicts."""
+    match = BATCH_BOUNDARY_RE.search(content_type)
+    if not match:
+        raise ValueError(f"Batch response is not multipart: {content_type}")
+
+    results = [{"error": {"code": 0, "message": "Missing batch response part"}} for _ in range(count)]
+    text = raw.decode().replace("\r\n", "\n")
+    for part in text.split(f"--{match.group(1)}"):
+        outer_headers, _, http_response = part.strip().partition("\n\n")
+        content_id = BATCH_CONTENT_ID_RE.search(outer_headers)
+        if not content_id or not http_response:
+            continue
+        status_line, _, rest = http_response.partition("\n")
+        _, _, body = rest.partition("\n\n")
+        status = int(status_line.split()[1])
+        body = body.strip()
+        try:
+            parsed = json.loads(body) if body else {}
+        except json.JSONDecodeError:
+            parsed = {"error": {"code": status, "message": body}}
+        if status >= 300 and "error" not in parsed:
+            parsed = {"error": {"code": status, "message": body}}
+        index = int(content_id.group(1))
+        if index < count:
+            results[index] = parsed
+    return results
+
+
 def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
@@ -681,24 +1126,49 @@ def _audit_recurring_meetings(
     threshold: float,
     min_instances: int,
     lookback_days: int,
-    lookahead_days: int
+    lookahead_days: int,
+    max_workers: int = DEFAULT_MAX_WORKERS
 ) -> tuple:
-    upcoming_events = client.list_events_paginated(
-        calendar_id=calendar_id,
-        time_min=_iso_z(created_at),
-        time_max=_iso_z(created_at + timedelta(days=lookahead_days)),
-    )
-    past_events = client.list_events_paginated(
-        calendar_id=calendar_id,
-        time_min=_iso_z(created_at - timedelta(days=lookback_days)),
-        time_max=_iso_z(created_at),
-    )
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        upcoming_future = pool.submit(
+            client.list_events_paginated,
+            calendar_id=calendar_id,
+            time_min=_iso_z(created_at),
+            time_max=_iso_z(created_at + timedelta(days=lookahead_days)),
+        )
+        past_future = pool.submit(
+            client.list_events_paginated,
+            calendar_id=calendar_id,
+            time_min=_iso_z(created_at - timedelta(days=lookback_days)),
+            time_max=_iso_z(created_at),
+        )
+        upcoming_events = upcoming_future.result()
+        past_events = past_future.result()
+
+        recurring_meetings = _unique_recurring_series(upcoming_events)
+
+        def fetch_series(series_id: str) -> tuple:
+            master_event = client.get_event(series_id, calendar_id)
+            prior_instances = client.list_event_instances(
+                series_id,
+                calendar_id=calendar_id,
+                time_min=_iso_z(created_at - timedelta(days=lookback_days)),
+                time_max=_iso_z(created_at),
+            )
+            return master_event, prior_instances
+
+        # Fetch every series' master event and history concurrently; results
+        # are consumed below in the original order
+        series_futures = [
+            pool.submit(fetch_series, next_instance["recurringEventId"])
+            for next_instance in recurring_meetings
+        ]
+
     past_instances_by_family = _group_recurring_instances_by_family(past_events)
-    recurring_meetings = _unique_recurring_series(upcoming_events)
     reviewed_meetings = []
     records = []
 
-    for next_instance in recurring_meetings:
+    for next_instance, series_future in zip(recurring_meetings, series_futures):
         series_id = next_instance["recurringEventId"]
         reviewed = {
             "series_id": series_id,
@@ -711,25 +1181,19 @@ def _audit_recurring_meetings(
             "recommendation_count": 0,
         }
         try:
-            master_event = client.get_event(series_id, calendar_id)
-            owner = master_event.get("organizer") or next_instance.get("organizer") or {}
-            reviewed.update({
-                "summary": master_event.get("summary") or reviewed["summary"],
-                "owner_email": _normalize_email(owner.get("email")) or "unknown",
-                "owner_name": owner.get("displayName", ""),
-                "owned_by_me": bool(owner.get("self")),
-            })
-            prior_instances = client.list_event_instances(
-                series_id,
-                calendar_id=calendar_id,
-                time_min=_iso_z(created_at - timedelta(days=lookback_days)),
-                time_max=_iso_z(created_at),
-            )
+            master_event, prior_instances = series_future.result()
         except Exception as exc:
             reviewed["status"] = f"skipped: {exc}"
             reviewed_meetings.append(reviewed)
             print(f"Warning: skipped recurring meeting {series_id}: {exc}", file=sys.stderr)
             continue
+        owner = master_event.get("organizer") or next_instance.get("organizer") or {}
+        reviewed.update({
+            "summary": master_event.get("summary") or reviewed["summary"],
+            "owner_email": _normalize_email(owner.get("email")) or "unknown",
+            "owner_name": owner.get("displayName", ""),
+            "owned_by_me": bool(owner.get("self")),
+        })
         combined_prior_instances = {
             event.get("id"): event
             for event in prior_instances + past_instances_by_family.get(_recurring_family_id(series_id), [])
@@ -888,7 +1352,7 @@ def _remove_attendees_from_recurring_event(
         "removed_emails": sorted(removed_emails),
         "missing_emails": missing_emails,
         "protected_emails": sorted(protected_emails),
-        "updated_event_id": updated.get("id", series_id) if updated else series_id,
+        "updated_event_id": updated.get("id", series_id),
     }
 
 
@@ -899,7 +1363,8 @@ def _remove_attendees_from_future_instances(
     emails: List[str],
     send_updates: str,
     future_start: Optional[datetime] = None,
-    max_instances: int = 2500
+    max_instances: int = 2500,
+    max_workers: int = DEFAULT_MAX_WORKERS
 ) -> dict:
     requested = {_normalize_email(email) for email in emails if _normalize_email(email)}
     if not requested:
@@ -922,10 +1387,10 @@ def _remove_attendees_from_future_instances(
         max_items=max_instances,
     )
 
-    updated_instances = 0
     removed_emails = set()
     protected_emails = set()
     seen_emails = set()
+    patches = []
 
     for instance in instances:
         if instance.get("status") == "cancelled":
@@ -953,13 +1418,20 @@ def _remove_attendees_from_future_instances(
                 kept_attendees.append(attendee)
 
         if removed_from_instance:
-            client.patch_event(
-                instance["id"],
+            patches.append((instance["id"], kept_attendees))
+
+    # Instance patches are independent, so send them concurrently
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        list(pool.map(
+            lambda patch: client.patch_event(
+                patch[0],
                 calendar_id=calendar_id,
-                patch_data={"attendees": kept_attendees},
+                patch_data={"attendees": patch[1]},
                 send_updates=send_updates
-            )
-            updated_instances += 1
+            ),
+            patches
+        ))
+    updated_instances = len(patches)
 
     missing_emails = sorted(requested - seen_emails)
     status = "success" if updated_instances else "noop"
@@ -984,7 +1456,8 @@ def _format_event_oneline(event: dict) -> str:
     # Get start time
     start = event.get("start", {})
     if "dateTime" in start:
-        start_str = start["dateTime"][:16].replace("T", " ")  # YYYY-MM-DD HH:MM
+        start_dt = start["dateTime"]
+        start_str = f"{start_dt[:10]} {start_dt[11:16]}"  # YYYY-MM-DD HH:MM
     elif "date" in start:
         start_str = start["date"] + " (all-day)"
     else:
@@ -996,52 +1469,46 @@ def _format_event_oneline(event: dict) -> str:
     return f"{event_id}: {summary}\n  {start_str}{location_str}"
 
 
-def _format_event_full(event: dict) -> str:
-    """Format full event details."""
-    lines = [
-        f"Event ID: {event.get('id', 'Unknown')}",
-        f"Summary: {event.get('summary', '(No title)')}",
-    ]
+def _format_when(label: str, when: dict) -> Optional[str]:
+    """Format a start/end block as one line, or None when it has no time."""
+    if "dateTime" in when:
+        return f"{label}: {when['dateTime']}"
+    if "date" in when:
+        return f"{label}: {when['date']} (all-day)"
+    return None
 
-    # Start time
-    start = event.get("start", {})
-    if "dateTime" in start:
-        lines.append(f"Start: {start['dateTime']}")
-    elif "date" in start:
-        lines.append(f"Start: {start['date']} (all-day)")
-
-    # End time
-    end = event.get("end", {})
-    if "dateTime" in end:
-        lines.append(f"End: {end['dateTime']}")
-    elif "date" in end:
-        lines.append(f"End: {end['date']} (all-day)")
-
-    # Optional fields
-    if "description" in event:
-        lines.append(f"Description: {event['description']}")
-    if "location" in event:
-        lines.append(f"Location: {event['location']}")
-
-    # Conference data (Zoom, Meet, etc.)
+
+def _format_conference(event: dict) -> List[str]:
+    """Format conference (Zoom, Meet, etc.) or Hangout link lines."""
     if "conferenceData" in event:
         conf = event["conferenceData"]
-        if "entryPoints" in conf:
-            for entry in conf["entryPoints"]:
-                if entry.get("entryPointType") == "video":
-                    lines.append(f"Video Link: {entry.get('uri', '')}")
+        lines = [
+            f"Video Link: {entry.get('uri', '')}"
+            for entry in conf.get("entryPoints", ())
+            if entry.get("entryPointType") == "video"
+        ]
         if "conferenceSolution" in conf:
             lines.append(f"Conference: {conf['conferenceSolution'].get('name', '')}")
-    elif "hangoutLink" in event:
-        lines.append(f"Hangout Link: {event['hangoutLink']}")
+        return lines
+    if "hangoutLink" in event:
+        return [f"Hangout Link: {event['hangoutLink']}"]
+    return []
 
-    if "attendees" in event:
-        attendee_emails = [a.get("email", "") for a in event["attendees"]]
-        lines.append(f"Attendees: {', '.join(attendee_emails)}")
-    if "htmlLink" in event:
-        lines.append(f"Link: {event['htmlLink']}")
 
-    return "\n".join(lines)
+def _format_event_full(event: dict) -> str:
+    """Format full event details."""
+    lines = [
+        f"Event ID: {event.get('id', 'Unknown')}",
+        f"Summary: {event.get('summary', '(No title)')}",
+        _format_when("Start", event.get("start", {})),
+        _format_when("End", event.get("end", {})),
+        f"Description: {event['description']}" if "description" in event else None,
+        f"Location: {event['location']}" if "location" in event else None,
+        *_format_conference(event),
+        f"Attendees: {', '.join(a.get('email', '') for a in event['attendees'])}" if "attendees" in event else None,
+        f"Link: {event['htmlLink']}" if "htmlLink" in event else None,
+    ]
+    return "\n".join(line for line in lines if line is not None)
 
 
 def _attendance_audit_audit_command(client: GCalendarClient, args: argparse.Namespace) -> int:
@@ -1139,177 +1606,238 @@ def _handle_remove_attendees_cli(client: GCalendarClient, argv: List[str]) -> in
     return 0
 
 
-def main():
-    """CLI interface for Google Calendar client."""
-    if len(sys.argv) < 2:
-        print("Usage: python -m sidekick.clients.gcalendar <command> [args]")
-        print("\nCommands:")
-        print("  list [time_min] [time_max] [max_results] - List events in date range")
-        print("  get <event_id>                            - Get event details")
-        print("  create <summary> <start> <end>            - Create new event")
-        print("  update <event_id> <field> <value>         - Update event field")
-        print("  delete <event_id> [--no-notify]           - Delete event")
-        print("  decline <event_id> [message] [--no-notify] - Decline event invitation")
-        print("  respond <event_id> <status> [comment] [--no-notify] - Respond to event (accepted/declined/tentative)")
-        print("  attendance-audit <subcommand>             - Audit recurring meeting RSVP history")
-        print("  remove-attendees --event-id ID --emails EMAILS - Remove attendees from an event")
-        print("\nFlags:")
-        print("  --no-notify  - Don't send email notifications to attendees/organizers")
-        print("\nExamples:")
-        print('  python -m sidekick.clients.gcalendar list "2024-01-01T00:00:00Z" "2024-01-31T23:59:59Z"')
-        print('  python -m sidekick.clients.gcalendar get abc123def456')
-        print('  python -m sidekick.clients.gcalendar create "Team Meeting" "2024-01-15T14:00:00Z" "2024-01-15T15:00:00Z"')
-        print('  python -m sidekick.clients.gcalendar update abc123def456 summary "Updated Title"')
-        print('  python -m sidekick.clients.gcalendar delete abc123def456 --no-notify')
-        print('  python -m sidekick.clients.gcalendar decline abc123def456 "Out of office" --no-notify')
-        print('  python -m sidekick.clients.gcalendar respond abc123def456 accepted "See you there!"')
-        print('  python -m sidekick.clients.gcalendar attendance-audit audit')
-        print('  python -m sidekick.clients.gcalendar remove-attendees --event-id abc123def456 --emails "a@example.com,b@example.com"')
+def _cmd_list(client: GCalendarClient, args: argparse.Namespace) -> None:
+    events = client.list_events(
+        time_min=args.time_min,
+        time_max=args.time_max,
+        max_results=args.max_results
+    )
+    # One write for the whole listing instead of two prints per event
+    sys.stdout.write(
+        f"Found {len(events)} events:\n\n"
+        + "".join(f"{_format_event_oneline(event)}\n\n" for event in events)
+    )
+
+
+def _cmd_get(client: GCalendarClient, args: argparse.Namespace) -> None:
+    event = client.get_event(args.event_id)
+    print(_format_event_full(event))
+
+
+def _cmd_create(client: GCalendarClient, args: argparse.Namespace) -> None:
+    event = client.create_event(args.summary, args.start_time, args.end_time)
+    print("Event created successfully!")
+    print(_format_event_full(event))
+
+
+def _cmd_update(client: GCalendarClient, args: argparse.Namespace) -> None:
+    # Map field names to update_event parameters
+    kwargs = {"event_id": args.event_id}
+    if args.field in ["summary", "description", "location"]:
+        kwargs[args.field] = args.value
+    elif args.field in ["start", "start_time"]:
+        kwargs["start_time"] = args.value
+    elif args.field in ["end", "end_time"]:
+        kwargs["end_time"] = args.value
+    else:
+        print(f"Error: Unknown field '{args.field}'. Use: summary, description, location, start_time, end_time", file=sys.stderr)
         sys.exit(1)
 
-    command = sys.argv[1]
-    if command == "attendance-audit" and ("--help" in sys.argv[2:] or "-h" in sys.argv[2:]):
-        sys.exit(_handle_attendance_audit_cli(None, sys.argv[2:]))
-    if command == "remove-attendees" and ("--help" in sys.argv[2:] or "-h" in sys.argv[2:]):
-        sys.exit(_handle_remove_attendees_cli(None, sys.argv[2:]))
+    event = client.update_event(**kwargs)
+    print("Event updated successfully!")
+    print(_format_event_full(event))
 
-    # Load configuration
-    try:
-        from sidekick.config import get_google_config
-        config = get_google_config()
-    except ImportError:
-        print("Error: Could not import config module", file=sys.stderr)
+
+def _cmd_delete(client: GCalendarClient, args: argparse.Namespace) -> None:
+    client.delete_event(args.event_id, send_updates=args.send_updates)
+    print(f"Event deleted successfully: {args.event_id}")
+
+
+def _cmd_create_batch(client: GCalendarClient, args: argparse.Namespace) -> None:
+    with open(args.file) as f:
+        events = json.load(f)
+    if not isinstance(events, list):
+        print("Error: JSON file must contain a list of event objects", file=sys.stderr)
         sys.exit(1)
-    except ValueError as e:
-        print(f"Configuration error: {e}", file=sys.stderr)
+
+    results = client.batch_create_events(events)
+    failures = sum(1 for result in results if "error" in result)
+    for result in results:
+        if "error" in result:
+            print(f"Error: {result['error'].get('message', result['error'])}")
+        else:
+            print(_format_event_oneline(result))
+    print(f"\nCreated {len(results) - failures} of {len(results)} events")
+    if failures:
         sys.exit(1)
 
-    # Create client
-    client = GCalendarClient(
-        client_id=config["client_id"],
-        client_secret=config["client_secret"],
-        refresh_token=config["refresh_token"]
+
+def _cmd_delete_batch(client: GCalendarClient, args: argparse.Namespace) -> None:
+    results = client.batch_delete_events(args.event_ids, send_updates=args.send_updates)
+    failures = 0
+    for event_id, result in zip(args.event_ids, results):
+        if "error" in result:
+            failures += 1
+            print(f"Error deleting {event_id}: {result['error'].get('message', result['error'])}")
+        else:
+            print(f"Event deleted successfully: {event_id}")
+    if failures:
+        sys.exit(1)
+
+
+def _cmd_decline(client: GCalendarClient, args: argparse.Namespace) -> None:
+    event = client.decline_event(args.event_id, message=args.message, send_updates=args.send_updates)
+    notify_msg = " (no notifications sent)" if args.send_updates == "none" else ""
+    print(f"Event declined successfully!{notify_msg}")
+    print(_format_event_full(event))
+
+
+def _cmd_respond(client: GCalendarClient, args: argparse.Namespace) -> None:
+    event = client.respond_to_event(
+        args.event_id,
+        args.response_status,
+        comment=args.comment,
+        send_updates=args.send_updates
+    )
+    notify_msg = " (no notifications sent)" if args.send_updates == "none" else ""
+    print(f"Event response set to '{args.response_status}' successfully!{notify_msg}")
+    print(_format_event_full(event))
+
+
+# Subcommands that parse their own arguments with a dedicated parser
+_DELEGATED_COMMANDS = {
+    "attendance-audit": _handle_attendance_audit_cli,
+    "remove-attendees": _handle_remove_attendees_cli,
+}
+
+_CLI_EXAMPLES = """\
+examples:
+  python -m sidekick.clients.gcalendar list "2024-01-01T00:00:00Z" "2024-01-31T23:59:59Z"
+  python -m sidekick.clients.gcalendar get abc123def456
+  python -m sidekick.clients.gcalendar create "Team Meeting" "2024-01-15T14:00:00Z" "2024-01-15T15:00:00Z"
+  python -m sidekick.clients.gcalendar update abc123def456 summary "Updated Title"
+  python -m sidekick.clients.gcalendar delete abc123def456 --no-notify
+  python -m sidekick.clients.gcalendar create-batch events.json
+  python -m sidekick.clients.gcalendar delete-batch abc123def456 ghi789jkl012 --no-notify
+  python -m sidekick.clients.gcalendar decline abc123def456 "Out of office" --no-notify
+  python -m sidekick.clients.gcalendar respond abc123def456 accepted "See you there!"
+  python -m sidekick.clients.gcalendar attendance-audit audit
+  python -m sidekick.clients.gcalendar remove-attendees --event-id abc123def456 --emails "a@example.com,b@example.com"
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once per process."""
+    parser = argparse.ArgumentParser(
+        prog="python -m sidekick.clients.gcalendar",
+        description="Google Calendar client.",
+        epilog=_CLI_EXAMPLES,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="<command>")
+
+    # --no-notify: don't send email notifications to attendees/organizers
+    notify = argparse.ArgumentParser(add_help=False)
+    notify.add_argument(
+        "--no-notify",
+        dest="send_updates",
+        action="store_const",
+        const="none",
+        default="all",
+        help="don't send email notifications to attendees/organizers"
     )
 
-    try:
-        if command == "attendance-audit":
-            sys.exit(_handle_attendance_audit_cli(client, sys.argv[2:]))
+    cmd = subparsers.add_parser("list", help="list events in date range")
+    cmd.add_argument("time_min", nargs="?")
+    cmd.add_argument("time_max", nargs="?")
+    cmd.add_argument("max_results", nargs="?", type=int, default=10)
+    cmd.set_defaults(func=_cmd_list)
 
-        elif command == "remove-attendees":
-            sys.exit(_handle_remove_attendees_cli(client, sys.argv[2:]))
+    cmd = subparsers.add_parser("get", help="get event details")
+    cmd.add_argument("event_id")
+    cmd.set_defaults(func=_cmd_get)
 
-        elif command == "list":
-            time_min = sys.argv[2] if len(sys.argv) > 2 else None
-            time_max = sys.argv[3] if len(sys.argv) > 3 else None
-            max_results = int(sys.argv[4]) if len(sys.argv) > 4 else 10
+    cmd = subparsers.add_parser("create", help="create new event")
+    cmd.add_argument("summary")
+    cmd.add_argument("start_time")
+    cmd.add_argument("end_time")
+    cmd.set_defaults(func=_cmd_create)
 
-            events = client.list_events(
-                time_min=time_min,
-                time_max=time_max,
-                max_results=max_results
-            )
-            print(f"Found {len(events)} events:\n")
-            for event in events:
-                print(_format_event_oneline(event))
-                print()
-
-        elif command == "get":
-            if len(sys.argv) < 3:
-                print("Error: Missing event_id argument", file=sys.stderr)
-                sys.exit(1)
-
-            event_id = sys.argv[2]
-            event = client.get_event(event_id)
-            print(_format_event_full(event))
-
-        elif command == "create":
-            if len(sys.argv) < 5:
-                print("Error: Missing arguments. Need: summary, start_time, end_time", file=sys.stderr)
-                sys.exit(1)
-
-            summary = sys.argv[2]
-            start_time = sys.argv[3]
-            end_time = sys.argv[4]
-
-            event = client.create_event(summary, start_time, end_time)
-            print("Event created successfully!")
-            print(_format_event_full(event))
-
-        elif command == "update":
-            if len(sys.argv) < 5:
-                print("Error: Missing arguments. Need: event_id, field, value", file=sys.stderr)
-                sys.exit(1)
-
-            event_id = sys.argv[2]
-            field = sys.argv[3]
-            value = sys.argv[4]
-
-            # Map field names to update_event parameters
-            kwargs = {"event_id": event_id}
-            if field in ["summary", "description", "location"]:
-                kwargs[field] = value
-            elif field in ["start", "start_time"]:
-                kwargs["start_time"] = value
-            elif field in ["end", "end_time"]:
-                kwargs["end_time"] = value
-            else:
-                print(f"Error: Unknown field '{field}'. Use: summary, description, location, start_time, end_time", file=sys.stderr)
-                sys.exit(1)
+    cmd = subparsers.add_parser("update", help="update event field (summary, description, location, start_time, end_time)")
+    cmd.add_argument("event_id")
+    cmd.add_argument("field")
+    cmd.add_argument("value")
+    cmd.set_defaults(func=_cmd_update)
 
-            event = client.update_event(**kwargs)
-            print("Event updated successfully!")
-            print(_format_event_full(event))
+    cmd = subparsers.add_parser("delete", parents=[notify], help="delete event")
+    cmd.add_argument("event_id")
+    cmd.set_defaults(func=_cmd_delete)
 
-        elif command == "delete":
-            if len(sys.argv) < 3:
-                print("Error: Missing event_id argument", file=sys.stderr)
-                sys.exit(1)
+    cmd = subparsers.add_parser("create-batch", help="create events from a JSON list in one batch call")
+    cmd.add_argument("file")
+    cmd.set_defaults(func=_cmd_create_batch)
 
-            event_id = sys.argv[2]
-            send_updates = "none" if "--no-notify" in sys.argv else "all"
-            client.delete_event(event_id, send_updates=send_updates)
-            print(f"Event deleted successfully: {event_id}")
+    cmd = subparsers.add_parser("delete-batch", parents=[notify], help="delete several events in one batch call")
+    cmd.add_argument("event_ids", nargs="+")
+    cmd.set_defaults(func=_cmd_delete_batch)
 
-        elif command == "decline":
-            if len(sys.argv) < 3:
-                print("Error: Missing event_id argument", file=sys.stderr)
-                sys.exit(1)
+    cmd = subparsers.add_parser("decline", parents=[notify], help="decline event invitation")
+    cmd.add_argument("event_id")
+    cmd.add_argument("message", nargs="?")
+    cmd.set_defaults(func=_cmd_decline)
 
-            event_id = sys.argv[2]
-            message = sys.argv[3] if len(sys.argv) > 3 and sys.argv[3] != "--no-notify" else None
-            send_updates = "none" if "--no-notify" in sys.argv else "all"
+    cmd = subparsers.add_parser("respond", parents=[notify], help="respond to event (accepted/declined/tentative)")
+    cmd.add_argument("event_id")
+    cmd.add_argument("response_status", choices=["accepted", "declined", "tentative"])
+    cmd.add_argument("comment", nargs="?")
+    cmd.set_defaults(func=_cmd_respond)
 
-            event = client.decline_event(event_id, message=message, send_updates=send_updates)
-            notify_msg = " (no notifications sent)" if send_updates == "none" else ""
-            print(f"Event declined successfully!{notify_msg}")
-            print(_format_event_full(event))
+    subparsers.add_parser("attendance-audit", add_help=False, help="audit recurring meeting RSVP history")
+    subparsers.add_parser("remove-attendees", add_help=False, help="remove attendees from an event")
+    return parser
 
-        elif command == "respond":
-            if len(sys.argv) < 4:
-                print("Error: Missing arguments. Need: event_id, status (accepted/declined/tentative)", file=sys.stderr)
-                sys.exit(1)
 
-            event_id = sys.argv[2]
-            response_status = sys.argv[3]
-            comment = sys.argv[4] if len(sys.argv) > 4 and sys.argv[4] != "--no-notify" else None
-            send_updates = "none" if "--no-notify" in sys.argv else "all"
+def main():
+    """CLI interface for Google Calendar client."""
+    parser = _build_parser()
+    argv = sys.argv[1:]
+    if not argv:
+        parser.print_help()
+        sys.exit(1)
 
-            if response_status not in ["accepted", "declined", "tentative"]:
-                print("Error: status must be 'accepted', 'declined', or 'tentative'", file=sys.stderr)
-                sys.exit(1)
+    command = argv[0]
+    delegated = _DELEGATED_COMMANDS.get(command)
+    if delegated and ("--help" in argv[1:] or "-h" in argv[1:]):
+        sys.exit(delegated(None, argv[1:]))
+    args = None if delegated else parser.parse_args(argv)
 
-            event = client.respond_to_event(event_id, response_status, comment=comment, send_updates=send_updates)
-            notify_msg = " (no notifications sent)" if send_updates == "none" else ""
-            print(f"Event response set to '{response_status}' successfully!{notify_msg}")
-            print(_format_event_full(event))
+    # Load configuration
+    if get_google_config is None:
+        print("Error: Could not import config module", file=sys.stderr)
+        sys.exit(1)
+    try:
+        config = get_google_config()
+    except ValueError as e:
+        print(f"Configuration error: {e}", file=sys.stderr)
+        sys.exit(1)
 
-        else:
-            print(f"Error: Unknown command '{command}'", file=sys.stderr)
-            sys.exit(1)
+    # Create client
+    client = GCalendarClient(
+        client_id=config["client_id"],
+        client_secret=config["client_secret"],
+        refresh_token=config["refresh_token"]
+    )
 
+    try:
+        if delegated:
+            sys.exit(delegated(client, argv[1:]))
+        args.func(client, args)
     except (ValueError, RuntimeError, ConnectionError) as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        client.close()
 
 
 if __name__ == "__main__":
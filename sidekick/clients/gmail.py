@@ -2,19 +2,83 @@
 
 import sys
 import json
+import re
 import base64
-import urllib.request
+import gzip
+import hashlib
+import http.client
+import os
+import random
+import threading
+import time
 import urllib.parse
-import urllib.error
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Optional, List
 from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+
+
+API_BASE_URL = "https://gmail.googleapis.com/gmail/v1"
+TOKEN_URL = "https://oauth2.googleapis.com/token"
+# Google only gzips responses when the User-Agent also mentions gzip
+COMPRESSION_HEADERS = {"Accept-Encoding": "gzip", "User-Agent": "sidekick-gmail/1.0 (gzip)"}
+JSON_HEADERS = {"Content-Type": "application/json", "Accept": "application/json", **COMPRESSION_HEADERS}
+DEFAULT_MAX_WORKERS = 10
+# Idle keep-alive connections kept per host between requests
+MAX_IDLE_CONNECTIONS = DEFAULT_MAX_WORKERS
+# Messages kept in the per-client get_message cache (least recently used evicted)
+MESSAGE_CACHE_SIZE = 256
+TOKEN_CACHE_PATH = Path.home() / ".cache" / "sidekick" / "gmail_token.json"
+# Access tokens are refreshed (and cached ones ignored) this long before
+# they expire, so requests never go out with a token about to lapse
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "PUT", "DELETE"}
+BODY_METHODS = {"POST", "PUT", "PATCH"}
+MAX_RETRIES = 5
+RETRY_BASE_DELAY_SECONDS = 0.5
+RETRY_MAX_DELAY_SECONDS = 10.0
+# Headers requested for list views, which never need message bodies
+METADATA_HEADERS = ["From", "To", "Subject", "Date", "Cc", "Bcc"]
+# Lowercased headers returned by get_message_headers()
+MESSAGE_HEADER_NAMES = frozenset({
+    "from",
+    "to",
+    "subject",
+    "date",
+    "cc",
+    "bcc",
+    "message-id",
+    "in-reply-to",
+    "references",
+})
+BATCH_URL = "https://www.googleapis.com/batch/gmail/v1"
+# Google advises at most 50 parts per Gmail batch; larger batches get
+# per-part rateLimitExceeded errors
+MAX_BATCH_SIZE = 50
+BATCH_BOUNDARY = "batch_sidekick_gmail"
+BATCH_CONTENT_TYPE = f"multipart/mixed; boundary={BATCH_BOUNDARY}"
+BATCH_CONTENT_ID_RE = re.compile(rb"^Content-ID:\s*<response-item-(\d+)>", re.IGNORECASE | re.MULTILINE)
+BATCH_BOUNDARY_RE = re.compile(r'boundary="?([^";]+)"?')
+BATCH_BLANK_LINE_RE = re.compile(rb"\r?\n\r?\n")
+# Shared compact encoder for request bodies; json.dumps would build a new
+# encoder on every call once non-default options are passed
+_JSON_BODY_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
 
 
 class GmailClient:
     """Gmail API client using native Python stdlib."""
 
-    def __init__(self, client_id: str, client_secret: str, refresh_token: str, timeout: int = 30):
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        refresh_token: str,
+        timeout: int = 30,
+        token_cache_path: Optional[Path] = TOKEN_CACHE_PATH,
+        message_cache_size: int = MESSAGE_CACHE_SIZE
+    ):
         """Initialize Gmail client with OAuth2 credentials.
 
         Args:
@@ -22,13 +86,139 @@ class GmailClient:
             client_secret: OAuth2 client secret
             refresh_token: OAuth2 refresh token
             timeout: Request timeout in seconds
+            token_cache_path: File used to reuse access tokens across
+                processes (None disables the disk cache)
+            message_cache_size: Number of fetched messages to keep in memory
+                (0 disables the cache)
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.refresh_token = refresh_token
         self.timeout = timeout
+        self.token_cache_path = Path(token_cache_path) if token_cache_path else None
         self.access_token = None
+        self.access_token_expires_at = 0.0
+        # Request headers for the current access token, rebuilt on refresh
+        self._base_headers = None
         self.api_call_count = 0
+        self._count_lock = threading.Lock()
+        # Message content never changes once stored, so fetched messages are
+        # cached by (id, format, metadata headers); label changes evict them
+        self.message_cache_size = message_cache_size
+        self._message_cache = OrderedDict()
+        self._message_cache_lock = threading.Lock()
+        self._token_lock = threading.Lock()
+        # Idle keep-alive HTTPS connections keyed by host. Each request checks
+        # one out and returns it afterwards, so concurrent callers never share
+        # a socket and connections outlive the worker threads that used them
+        self._idle_connections = {}
+        self._connections_lock = threading.Lock()
+
+    def _checkout_connection(self, host: str) -> tuple:
+        """Take an idle keep-alive connection for a host, or open a new one.
+
+        Returns:
+            tuple of (connection: HTTPSConnection, reused: bool)
+        """
+        with self._connections_lock:
+            idle = self._idle_connections.get(host)
+            if idle:
+                return idle.pop(), True
+        return http.client.HTTPSConnection(host, timeout=self.timeout), False
+
+    def _return_connection(self, host: str, conn: http.client.HTTPSConnection) -> None:
+        """Put a connection back in the idle pool, closing it if the pool is full."""
+        with self._connections_lock:
+            idle = self._idle_connections.setdefault(host, [])
+            if len(idle) < MAX_IDLE_CONNECTIONS:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close all idle keep-alive connections."""
+        with self._connections_lock:
+            idle, self._idle_connections = self._idle_connections, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[dict] = None
+    ) -> tuple:
+        """Send an HTTP request over a reused keep-alive connection.
+
+        A connection that the server closed while idle is reopened and the
+        request is sent once more; any other failure is not retried.
+
+        Returns:
+            tuple of (status: int, headers: HTTPMessage, body: bytes)
+
+        Raises:
+            ConnectionError: For network errors
+        """
+        parts = urllib.parse.urlsplit(url)
+        path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        host = parts.netloc
+
+        for attempt in range(2):
+            conn, reused = self._checkout_connection(host)
+            try:
+                conn.request(method, path, body=body, headers=headers or {})
+                response = conn.getresponse()
+                raw = response.read()
+                if response.headers.get("Content-Encoding") == "gzip":
+                    raw = gzip.decompress(raw)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise ConnectionError(f"Network error: {e}")
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                raise ConnectionError(f"Network error: {e}")
+            self._return_connection(host, conn)
+            return response.status, response.headers, raw
+
+    def _send_with_backoff(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[dict] = None
+    ) -> tuple:
+        """Send a request, retrying transient failures with exponential backoff.
+
+        5xx responses and network errors are retried only for idempotent
+        methods, since a POST or PATCH may already have applied; those are
+        retried only on 429, or on 503 when the server sends Retry-After.
+        A Retry-After header, when present, sets the delay.
+
+        Returns:
+            tuple of (status: int, headers: HTTPMessage, body: bytes) from the
+            last attempt
+
+        Raises:
+            ConnectionError: For network errors after the last attempt
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            last_attempt = attempt == MAX_RETRIES
+            try:
+                status, response_headers, raw = self._send(method, url, body=body, headers=headers)
+            except ConnectionError:
+                if last_attempt or method not in IDEMPOTENT_METHODS:
+                    raise
+                delay = _backoff_delay(attempt)
+            else:
+                retry_after = _parse_retry_after(response_headers.get("Retry-After"))
+                if last_attempt or not _is_retryable_status(method, status, retry_after):
+                    return status, response_headers, raw
+                delay = retry_after if retry_after is not None else _backoff_delay(attempt)
+            time.sleep(delay)
 
     def _refresh_access_token(self) -> str:
         """Refresh OAuth2 access token using refresh token.
@@ -39,7 +229,6 @@ class GmailClient:
         Raises:
             ValueError: If token refresh fails
         """
-        token_url = "https://oauth2.googleapis.com/token"
         data = {
             "client_id": self.client_id,
             "client_secret": self.client_secret,
@@ -48,24 +237,134 @@ class GmailClient:
         }
 
         encoded_data = urllib.parse.urlencode(data).encode()
-        req = urllib.request.Request(token_url, data=encoded_data, method="POST")
-        req.add_header("Content-Type", "application/x-www-form-urlencoded")
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
+        # Goes over the same keep-alive connection pool as API calls
+        status, _, body = self._send("POST", TOKEN_URL, body=encoded_data, headers=headers)
+        if status >= 400:
+            raise ValueError(f"Failed to refresh access token: {status} - {body.decode()}")
         try:
-            with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                result = json.loads(response.read().decode())
-                return result["access_token"]
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode() if e.fp else ""
-            raise ValueError(f"Failed to refresh access token: {e.code} - {error_body}")
+            result = json.loads(body)
+            access_token = result["access_token"]
         except (KeyError, json.JSONDecodeError):
             raise ValueError("Invalid token response")
 
+        self.access_token_expires_at = time.time() + result.get("expires_in", 3600)
+        self._save_cached_token(access_token, self.access_token_expires_at)
+        return access_token
+
+    def _token_cache_key(self) -> str:
+        """Identify cached tokens by refresh token without storing it in the clear."""
+        return hashlib.sha256((self.refresh_token or "").encode()).hexdigest()[:16]
+
+    def _load_cached_token(self) -> Optional[str]:
+        """Load an access token from the disk cache if it is not about to expire."""
+        if not self.token_cache_path:
+            return None
+        try:
+            cached = json.loads(self.token_cache_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if cached.get("client_id") != self.client_id or cached.get("key") != self._token_cache_key():
+            return None
+        if cached.get("expires_at", 0) - TOKEN_EXPIRY_MARGIN_SECONDS <= time.time():
+            return None
+        self.access_token_expires_at = cached["expires_at"]
+        return cached.get("access_token")
+
+    def _save_cached_token(self, access_token: str, expires_at: float) -> None:
+        """Atomically write the access token to the disk cache (owner read/write only)."""
+        if not self.token_cache_path:
+            return
+        tmp_path = self.token_cache_path.with_name(f"{self.token_cache_path.name}.{os.getpid()}.tmp")
+        try:
+            self.token_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump({
+                    "client_id": self.client_id,
+                    "key": self._token_cache_key(),
+                    "access_token": access_token,
+                    "expires_at": expires_at,
+                }, f)
+            os.replace(tmp_path, self.token_cache_path)
+        except OSError:
+            # The cache is an optimization; a failed write just means a refresh next time
+            pass
+
+    def invalidate_token(self) -> None:
+        """Forget the current access token in memory and on disk."""
+        with self._token_lock:
+            self.access_token = None
+            self.access_token_expires_at = 0.0
+            self._base_headers = None
+        if self.token_cache_path:
+            try:
+                self.token_cache_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _token_is_fresh(self) -> bool:
+        """Whether the in-memory token is set and not close to expiring."""
+        return bool(self.access_token) and time.time() < self.access_token_expires_at - TOKEN_EXPIRY_MARGIN_SECONDS
+
     def _get_access_token(self) -> str:
-        """Get valid access token, refreshing if necessary."""
-        if not self.access_token:
-            self.access_token = self._refresh_access_token()
-        return self.access_token
+        """Get valid access token, loading it from the disk cache or refreshing.
+
+        Tokens are refreshed shortly before they expire rather than after a
+        401.
+        """
+        with self._token_lock:
+            self._ensure_fresh_token()
+            return self.access_token
+
+    def _ensure_fresh_token(self) -> None:
+        """Load or refresh the access token if needed; callers hold _token_lock.
+
+        Concurrent callers share a single refresh, and nobody reads the token
+        or its headers while invalidate_token is clearing them.
+        """
+        if not self._token_is_fresh():
+            self.access_token = self._load_cached_token() or self._refresh_access_token()
+            self._base_headers = {"Authorization": f"Bearer {self.access_token}", **JSON_HEADERS}
+
+    def _get_base_headers(self) -> dict:
+        """Get the shared request headers for a valid access token.
+
+        The dict is reused across requests and must not be mutated.
+        """
+        with self._token_lock:
+            self._ensure_fresh_token()
+            return self._base_headers
+
+    def _get_cached_message(self, key: tuple) -> Optional[dict]:
+        """Return a cached message and mark it recently used, if present."""
+        with self._message_cache_lock:
+            message = self._message_cache.get(key)
+            if message is not None:
+                self._message_cache.move_to_end(key)
+            return message
+
+    def _cache_message(self, key: tuple, message: dict) -> None:
+        """Store a fetched message, evicting the least recently used on overflow."""
+        if self.message_cache_size <= 0:
+            return
+        with self._message_cache_lock:
+            self._message_cache[key] = message
+            self._message_cache.move_to_end(key)
+            while len(self._message_cache) > self.message_cache_size:
+                self._message_cache.popitem(last=False)
+
+    def _evict_cached_message(self, message_id: str) -> None:
+        """Drop every cached format of a message (e.g. after its labels change)."""
+        with self._message_cache_lock:
+            for key in [key for key in self._message_cache if key[0] == message_id]:
+                del self._message_cache[key]
+
+    def _count_api_call(self) -> None:
+        """Increment api_call_count; requests may run on worker threads."""
+        with self._count_lock:
+            self.api_call_count += 1
 
     def _request(
         self,
@@ -93,51 +392,48 @@ class GmailClient:
             RuntimeError: For 5xx server errors
         """
         # Build URL
-        base_url = "https://gmail.googleapis.com/gmail/v1"
-        url = f"{base_url}{endpoint}"
+        url = f"{API_BASE_URL}{endpoint}"
         if params:
-            url += "?" + urllib.parse.urlencode(params)
+            url += "?" + urllib.parse.urlencode(params, doseq=True)
 
-        # Prepare request
-        headers = {
-            "Authorization": f"Bearer {self._get_access_token()}",
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
-        data = json.dumps(json_data).encode() if json_data else None
-        req = urllib.request.Request(url, data=data, headers=headers, method=method)
+        data = _encode_json_body(json_data) if json_data and method in BODY_METHODS else None
+        status, _, raw = self._send_with_backoff(method, url, body=data, headers=self._get_base_headers())
 
-        try:
-            with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                self.api_call_count += 1
-                body = response.read().decode()
-                if not body or body.strip() == "":
-                    return {}
-                return json.loads(body)
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode() if e.fp else ""
+        if status >= 300:
+            error_body = raw.decode()
 
             # Retry once on 401 (token might be expired)
-            if e.code == 401 and retry_auth:
-                self.access_token = None  # Force token refresh
+            if status == 401 and retry_auth:
+                self.invalidate_token()  # Force token refresh
                 return self._request(method, endpoint, params, json_data, retry_auth=False)
 
-            if e.code == 404:
-                raise ValueError(f"Resource not found: {endpoint}")
-            elif e.code >= 400 and e.code < 500:
-                raise ValueError(f"Client error {e.code}: {error_body}")
-            elif e.code >= 500:
-                raise RuntimeError(f"Server error {e.code}: {error_body}")
-            else:
-                raise ConnectionError(f"HTTP error {e.code}: {error_body}")
-        except urllib.error.URLError as e:
-            raise ConnectionError(f"Network error: {e.reason}")
+            self._raise_for_status(status, endpoint, error_body)
+
+        self._count_api_call()
+        # Empty bodies (204s, many POST/DELETE replies) need no JSON parse; check
+        # with isspace() since strip() would copy large bodies first
+        if status == 204 or not raw or raw.isspace():
+            return {}
+        # json.loads accepts UTF-8 bytes, so skip the intermediate str copy
+        return json.loads(raw)
+
+    def _raise_for_status(self, status: int, endpoint: str, error_body: str) -> None:
+        """Raise the client's standard exception for an HTTP error status."""
+        if status == 404:
+            raise ValueError(f"Resource not found: {endpoint}")
+        elif status >= 400 and status < 500:
+            raise ValueError(f"Client error {status}: {error_body}")
+        elif status >= 500:
+            raise RuntimeError(f"Server error {status}: {error_body}")
+        else:
+            raise ConnectionError(f"HTTP error {status}: {error_body}")
 
     def search_messages(
         self,
         query: str,
         max_results: int = 10,
-        include_spam_trash: bool = False
+        include_spam_trash: bool = False,
+        format: str = "full"
     ) -> List[dict]:
         """Search for messages matching a query.
 
@@ -145,9 +441,14 @@ class GmailClient:
             query: Gmail search query (uses same syntax as Gmail search box)
             max_results: Maximum number of results to return
             include_spam_trash: Whether to include spam and trash
+            format: Message format for the results. "metadata" returns only
+                the headers (From, To, Subject, Date, Cc, Bcc) and snippet,
+                skipping bodies for list views that don't need them
 
         Returns:
-            List of message dicts with id, threadId, and snippet
+            List of message dicts with id, threadId, and snippet. Bodies are
+            never decoded here; call get_message_body() on the messages that
+            actually need one (requires the default format="full").
 
         Example queries:
             "from:someone@example.com"
@@ -164,31 +465,164 @@ class GmailClient:
 
         result = self._request("GET", "/users/me/messages", params=params)
         messages = result.get("messages", [])
+        if not messages:
+            return []
+
+        # Get full details for all messages in one batch round-trip, falling
+        # back to concurrent per-message fetches if the batch call fails
+        message_ids = [msg["id"] for msg in messages]
+        metadata_headers = METADATA_HEADERS if format == "metadata" else None
+        try:
+            details = self._batch_get_messages(message_ids, format, metadata_headers)
+        except (ValueError, RuntimeError, ConnectionError):
+            details = self.get_messages(message_ids, format, metadata_headers)
+
+        # If we can't get details for a message, include basic info
+        return [
+            msg if "error" in detail else detail
+            for msg, detail in zip(messages, details)
+        ]
+
+    def get_messages(
+        self,
+        message_ids: List[str],
+        format: str = "full",
+        metadata_headers: Optional[List[str]] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> List[dict]:
+        """Get several messages concurrently.
+
+        Requests run on a thread pool sharing this client's keep-alive
+        connections, so total latency is roughly that of the slowest fetch
+        rather than the sum of all of them.
+
+        Args:
+            message_ids: Message IDs to fetch
+            format: Message format (full, metadata, minimal, raw)
+            metadata_headers: Headers to include when format is "metadata"
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            List of message dicts in the same order as message_ids. A message
+            that could not be fetched is returned as {"id": ..., "error": ...}.
+        """
+        if not message_ids:
+            return []
 
-        # Get full details for each message
-        detailed_messages = []
-        for msg in messages:
+        def fetch(message_id):
             try:
-                full_msg = self.get_message(msg["id"])
-                detailed_messages.append(full_msg)
-            except Exception as e:
-                # If we can't get details, include basic info
-                detailed_messages.append(msg)
+                return self.get_message(message_id, format=format, metadata_headers=metadata_headers)
+            except (ValueError, RuntimeError, ConnectionError) as e:
+                return {"id": message_id, "error": str(e)}
+
+        # Refresh the token once up front rather than in every worker
+        self._get_access_token()
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(message_ids))) as executor:
+            return list(executor.map(fetch, message_ids))
 
-        return detailed_messages
+    def _batch_get_messages(
+        self,
+        message_ids: List[str],
+        format: str = "full",
+        metadata_headers: Optional[List[str]] = None
+    ) -> List[dict]:
+        """Fetch many messages through the Gmail batch endpoint.
+
+        IDs are packed into multipart/mixed requests of up to MAX_BATCH_SIZE
+        parts, so N messages cost ceil(N / 50) round-trips instead of N. Parts
+        that fail with a rate-limit or server error are fetched again one by
+        one through get_messages, which retries with backoff.
+
+        Args:
+            message_ids: Message IDs to fetch
+            format: Message format (full, metadata, minimal, raw)
+            metadata_headers: Headers to include when format is "metadata"
 
-    def get_message(self, message_id: str, format: str = "full") -> dict:
+        Returns:
+            List of message dicts in request order. Parts that still failed
+            have an "error" key.
+        """
+        key_suffix = (format, tuple(metadata_headers or ()))
+        results = [self._get_cached_message((message_id,) + key_suffix) for message_id in message_ids]
+        missing = [index for index, result in enumerate(results) if result is None]
+        if not missing:
+            return results
+
+        query = urllib.parse.urlencode(
+            {"format": format, "metadataHeaders": metadata_headers or []},
+            doseq=True
+        )
+        for start in range(0, len(missing), MAX_BATCH_SIZE):
+            chunk = missing[start:start + MAX_BATCH_SIZE]
+            fetched = self._send_batch([message_ids[index] for index in chunk], query)
+            for index, message in zip(chunk, fetched):
+                results[index] = message
+                if "error" not in message:
+                    self._cache_message((message_ids[index],) + key_suffix, message)
+
+        transient = [index for index in missing if _is_transient_batch_error(results[index])]
+        if transient:
+            refetched = self.get_messages([message_ids[index] for index in transient], format, metadata_headers)
+            for index, message in zip(transient, refetched):
+                results[index] = message
+        return results
+
+    def _send_batch(self, message_ids: List[str], query: str, retry_auth: bool = True) -> List[dict]:
+        """Send one multipart batch of message GETs (at most MAX_BATCH_SIZE parts).
+
+        query is the URL-encoded query string shared by every part.
+        """
+        parts = [
+            f"--{BATCH_BOUNDARY}\r\n"
+            "Content-Type: application/http\r\n"
+            f"Content-ID: <item-{index}>\r\n\r\n"
+            f"GET /gmail/v1/users/me/messages/{message_id}?{query} HTTP/1.1\r\n\r\n"
+            for index, message_id in enumerate(message_ids)
+        ]
+        body = ("".join(parts) + f"--{BATCH_BOUNDARY}--\r\n").encode()
+
+        headers = {**self._get_base_headers(), "Content-Type": BATCH_CONTENT_TYPE}
+        status, response_headers, raw = self._send_with_backoff("POST", BATCH_URL, body=body, headers=headers)
+
+        # Retry once on 401 (token might be expired)
+        if status == 401 and retry_auth:
+            self.invalidate_token()  # Force token refresh
+            return self._send_batch(message_ids, query, retry_auth=False)
+        if status >= 300:
+            self._raise_for_status(status, BATCH_URL, raw.decode())
+
+        self._count_api_call()
+        return _parse_batch_response(response_headers.get("Content-Type", ""), raw, len(message_ids))
+
+    def get_message(
+        self,
+        message_id: str,
+        format: str = "full",
+        metadata_headers: Optional[List[str]] = None
+    ) -> dict:
         """Get a specific message by ID.
 
         Args:
             message_id: The message ID
             format: Message format (full, metadata, minimal, raw)
+            metadata_headers: Headers to include when format is "metadata"
+                (all headers when omitted)
 
         Returns:
-            Message dict with full details
+            Message dict with full details. Repeat lookups are served from an
+            in-memory cache, so treat the dict as read-only.
         """
+        key = (message_id, format, tuple(metadata_headers or ()))
+        cached = self._get_cached_message(key)
+        if cached is not None:
+            return cached
+
         params = {"format": format}
-        return self._request("GET", f"/users/me/messages/{message_id}", params=params)
+        if metadata_headers:
+            params["metadataHeaders"] = metadata_headers
+        message = self._request("GET", f"/users/me/messages/{message_id}", params=params)
+        self._cache_message(key, message)
+        return message
 
     def get_thread(self, thread_id: str, format: str = "full") -> dict:
         """Get a Gmail thread by ID.
@@ -203,7 +637,8 @@ class GmailClient:
         params = {"format": format}
         return self._request("GET", f"/users/me/threads/{thread_id}", params=params)
 
-    def get_message_body(self, message: dict) -> str:
+    @staticmethod
+    def get_message_body(message: dict) -> str:
         """Extract text body from a message.
 
         Args:
@@ -212,53 +647,46 @@ class GmailClient:
         Returns:
             Plain text body of the message
         """
+        b64decode = base64.urlsafe_b64decode
+
         def decode_body(part):
             """Decode base64url encoded body."""
             if "data" in part.get("body", {}):
                 data = part["body"]["data"]
-                # Gmail uses base64url encoding
-                data = data.replace("-", "+").replace("_", "/")
-                # Add padding if necessary
-                padding = 4 - (len(data) % 4)
-                if padding != 4:
-                    data += "=" * padding
-                return base64.b64decode(data).decode("utf-8", errors="ignore")
+                # Gmail uses unpadded base64url encoding
+                padding = "=" * (-len(data) % 4)
+                return b64decode(data + padding).decode("utf-8", errors="ignore")
             return ""
 
         def extract_text(payload):
-            """Recursively extract text from message payload."""
-            mime_type = payload.get("mimeType", "")
-
-            if mime_type == "text/plain":
-                return decode_body(payload)
-            elif mime_type == "text/html":
-                # If we only have HTML, return it (better than nothing)
-                return decode_body(payload)
-            elif "parts" in payload:
-                # Multipart message - prefer text/plain over text/html
-                text_parts = []
-                html_parts = []
-                for part in payload["parts"]:
-                    if part.get("mimeType") == "text/plain":
-                        text_parts.append(extract_text(part))
-                    elif part.get("mimeType") == "text/html":
-                        html_parts.append(extract_text(part))
-                    else:
-                        # Recurse into nested parts
-                        text_parts.append(extract_text(part))
-
-                # Return text/plain if available, otherwise HTML
-                if text_parts:
-                    return "\n".join(filter(None, text_parts))
-                return "\n".join(filter(None, html_parts))
-
-            return ""
+            """Collect text from a message payload, preferring text/plain over text/html.
+
+            Walks the MIME tree with an explicit stack in document order, so
+            deeply nested multiparts don't recurse or build per-level strings.
+            """
+            text_parts = []
+            html_parts = []
+            stack = [payload]
+            while stack:
+                part = stack.pop()
+                mime_type = part.get("mimeType", "")
+                if mime_type == "text/plain":
+                    text_parts.append(decode_body(part))
+                elif mime_type == "text/html":
+                    html_parts.append(decode_body(part))
+                elif "parts" in part:
+                    stack.extend(reversed(part["parts"]))
+
+            # Return text/plain if available; if we only have HTML, return it
+            # (better than nothing)
+            return "\n".join(filter(None, text_parts)) or "\n".join(filter(None, html_parts))
 
         if "payload" in message:
             return extract_text(message["payload"])
         return ""
 
-    def get_message_headers(self, message: dict) -> dict:
+    @staticmethod
+    def get_message_headers(message: dict) -> dict:
         """Extract common headers from a message.
 
         Args:
@@ -267,23 +695,13 @@ class GmailClient:
         Returns:
             Dict with headers: from, to, subject, date
         """
-        headers = {}
-        if "payload" in message and "headers" in message["payload"]:
-            for header in message["payload"]["headers"]:
-                name = header["name"].lower()
-                if name in [
-                    "from",
-                    "to",
-                    "subject",
-                    "date",
-                    "cc",
-                    "bcc",
-                    "message-id",
-                    "in-reply-to",
-                    "references",
-                ]:
-                    headers[name] = header["value"]
-        return headers
+        headers = message.get("payload", {}).get("headers", ())
+        return {
+            name: header["value"]
+            for header in headers
+            for name in (header["name"].lower(),)
+            if name in MESSAGE_HEADER_NAMES
+        }
 
     def create_draft(
         self,
@@ -305,8 +723,8 @@ class GmailClient:
         Returns:
             Draft dict with id and message
         """
-        # Create MIME message
-        message = MIMEMultipart()
+        # Create MIME message; a single text/plain part needs no multipart envelope
+        message = MIMEText(body, "plain")
         message["To"] = to
         message["Subject"] = subject
         if cc:
@@ -314,9 +732,6 @@ class GmailClient:
         if bcc:
             message["Bcc"] = bcc
 
-        # Add body
-        message.attach(MIMEText(body, "plain"))
-
         # Encode message
         raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
 
@@ -355,8 +770,8 @@ class GmailClient:
         Returns:
             Sent message dict with id, threadId, and labelIds
         """
-        # Create MIME message
-        message = MIMEMultipart()
+        # Create MIME message; a single text/plain part needs no multipart envelope
+        message = MIMEText(body, "plain")
         message["To"] = to
         message["Subject"] = subject
         if cc:
@@ -370,9 +785,6 @@ class GmailClient:
         if references:
             message["References"] = references
 
-        # Add body
-        message.attach(MIMEText(body, "plain"))
-
         # Encode message
         raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
 
@@ -416,6 +828,7 @@ class GmailClient:
         if remove_labels:
             modify_data["removeLabelIds"] = remove_labels
 
+        self._evict_cached_message(message_id)
         return self._request(
             "POST",
             f"/users/me/messages/{message_id}/modify",
@@ -423,9 +836,78 @@ class GmailClient:
         )
 
 
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff delay with jitter for a zero-based retry attempt."""
+    return min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * 2 ** attempt) + random.uniform(0, 1)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def _is_retryable_status(method: str, status: int, retry_after: Optional[float]) -> bool:
+    """Check whether a response status may be retried for this method."""
+    if status not in RETRY_STATUSES:
+        return False
+    if method in IDEMPOTENT_METHODS or status == 429:
+        return True
+    return status == 503 and retry_after is not None
+
+
+def _encode_json_body(data) -> bytes:
+    """Encode a request body as compact UTF-8 JSON."""
+    return _JSON_BODY_ENCODER.encode(data).encode("utf-8")
+
+
+def _parse_batch_response(content_type: str, raw: bytes, count: int) -> List[dict]:
+    """Split a multipart/mixed batch response into per-request result dicts.
+
+    Works on the raw bytes throughout so large message bodies are never
+    copied into intermediate strings before JSON parsing.
+    """
+    match = BATCH_BOUNDARY_RE.search(content_type)
+    if not match:
+        raise ValueError(f"Batch response is not multipart: {content_type}")
+
+    results = [{"error": {"code": 0, "message": "Missing batch response part"}} for _ in range(count)]
+    for part in raw.split(b"--" + match.group(1).encode()):
+        sections = BATCH_BLANK_LINE_RE.split(part.strip(), 2)
+        if len(sections) < 2:
+            continue
+        content_id = BATCH_CONTENT_ID_RE.search(sections[0])
+        if not content_id:
+            continue
+        status = int(sections[1].split(None, 2)[1])
+        body = sections[2].strip() if len(sections) > 2 else b""
+        try:
+            parsed = json.loads(body) if body else {}
+        except ValueError:
+            parsed = {"error": {"code": status, "message": body.decode(errors="replace")}}
+        if status >= 300 and "error" not in parsed:
+            parsed = {"error": {"code": status, "message": body.decode(errors="replace")}}
+        index = int(content_id.group(1))
+        if index < count:
+            results[index] = parsed
+    return results
+
+
+def _is_transient_batch_error(result: dict) -> bool:
+    """Check whether a batch part failed with a retryable (429/5xx) or missing response."""
+    error = result.get("error")
+    if not isinstance(error, dict):
+        return False
+    # Code 0 marks a part the batch response left out
+    return error.get("code") in RETRY_STATUSES or error.get("code") == 0
+
+
 def _format_message_oneline(message: dict) -> str:
     """Format message as one-line summary."""
-    headers = GmailClient(None, None, None).get_message_headers(message)
+    headers = GmailClient.get_message_headers(message)
     from_addr = headers.get("from", "Unknown")
     subject = headers.get("subject", "(No subject)")
     snippet = message.get("snippet", "")
@@ -440,9 +922,8 @@ def _format_message_oneline(message: dict) -> str:
 
 def _format_message_full(message: dict) -> str:
     """Format full message details."""
-    client = GmailClient(None, None, None)
-    headers = client.get_message_headers(message)
-    body = client.get_message_body(message)
+    headers = GmailClient.get_message_headers(message)
+    body = GmailClient.get_message_body(message)
 
     lines = [
         f"Message ID: {message.get('id', 'Unknown')}",
@@ -469,15 +950,23 @@ def _format_message_full(message: dict) -> str:
 
 def main():
     """CLI interface for Gmail client."""
-    if len(sys.argv) < 2:
-        print("Usage: python -m sidekick.clients.gmail <command> [args]")
+    args = sys.argv[1:]
+    use_token_cache = "--no-cache" not in args
+    if not use_token_cache:
+        args = [arg for arg in args if arg != "--no-cache"]
+
+    if not args:
+        print("Usage: python -m sidekick.clients.gmail [--no-cache] <command> [args]")
+        print("\nOptions:")
+        print("  --no-cache                    - Don't read or write the access token cache")
         print("\nCommands:")
         print("  search <query> [max_results]  - Search for messages")
-        print("  get <message_id>              - Get full message details")
+        print("  get <message_id> [...]        - Get full message details (several IDs use one batch call)")
         print("  create-draft <to> <subject> <body> - Create draft email")
         print("\nExample:")
         print('  python -m sidekick.clients.gmail search "from:someone@example.com" 5')
         print('  python -m sidekick.clients.gmail get 18f2c4e5a1b2c3d4')
+        print('  python -m sidekick.clients.gmail get 18f2c4e5a1b2c3d4 18f2c4e5a1b2c3d5')
         print('  python -m sidekick.clients.gmail create-draft "user@example.com" "Hello" "Email body here"')
         sys.exit(1)
 
@@ -496,43 +985,60 @@ def main():
     client = GmailClient(
         client_id=config["client_id"],
         client_secret=config["client_secret"],
-        refresh_token=config["refresh_token"]
+        refresh_token=config["refresh_token"],
+        token_cache_path=TOKEN_CACHE_PATH if use_token_cache else None
     )
 
-    command = sys.argv[1]
+    command = args[0]
 
     try:
         if command == "search":
-            if len(sys.argv) < 3:
+            if len(args) < 2:
                 print("Error: Missing query argument", file=sys.stderr)
                 sys.exit(1)
 
-            query = sys.argv[2]
-            max_results = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+            query = args[1]
+            max_results = int(args[2]) if len(args) > 2 else 10
 
-            messages = client.search_messages(query, max_results=max_results)
+            # The listing only prints headers and the snippet
+            messages = client.search_messages(query, max_results=max_results, format="metadata")
             print(f"Found {len(messages)} messages:\n")
             for msg in messages:
                 print(_format_message_oneline(msg))
                 print()
 
         elif command == "get":
-            if len(sys.argv) < 3:
+            if len(args) < 2:
                 print("Error: Missing message_id argument", file=sys.stderr)
                 sys.exit(1)
 
-            message_id = sys.argv[2]
-            message = client.get_message(message_id)
-            print(_format_message_full(message))
+            message_ids = args[1:]
+            if len(message_ids) == 1:
+                # A single ID doesn't need the multipart batch overhead
+                print(_format_message_full(client.get_message(message_ids[0])))
+            else:
+                failed = False
+                messages = client._batch_get_messages(message_ids, "full")
+                for message_id, message in zip(message_ids, messages):
+                    if "error" in message:
+                        error = message["error"]
+                        detail = error.get("message", error) if isinstance(error, dict) else error
+                        print(f"Error: {message_id}: {detail}", file=sys.stderr)
+                        failed = True
+                        continue
+                    print(_format_message_full(message))
+                    print()
+                if failed:
+                    sys.exit(1)
 
         elif command == "create-draft":
-            if len(sys.argv) < 5:
+            if len(args) < 4:
                 print("Error: Missing arguments. Need: to, subject, body", file=sys.stderr)
                 sys.exit(1)
 
-            to = sys.argv[2]
-            subject = sys.argv[3]
-            body = sys.argv[4]
+            to = args[1]
+            subject = args[2]
+            body = args[3]
 
             draft = client.create_draft(to, subject, body)
             print("Draft created successfully!")
@@ -546,6 +1052,8 @@ def main():
     except (ValueError, RuntimeError, ConnectionError) as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        client.close()
 
 
 if __name__ == "__main__":
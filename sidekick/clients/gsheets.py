@@ -3,17 +3,80 @@
 import sys
 import json
 import csv
-import urllib.request
+import gzip
+import hashlib
+import http.client
+import itertools
+import os
+import random
+import re
+import shutil
+import threading
+import time
 import urllib.parse
-import urllib.error
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, List, Tuple
 from io import StringIO
 
 
+DEFAULT_MAX_WORKERS = 8
+# Idle keep-alive connections kept per host between requests
+MAX_IDLE_CONNECTIONS = DEFAULT_MAX_WORKERS
+# Rows per values.update shard for large writes, and shards sent at once
+CHUNK_ROWS = 5000
+CHUNK_MAX_WORKERS = 4
+TOKEN_CACHE_PATH = Path.home() / ".cache" / "sidekick" / "gsheets_token.json"
+# Access tokens are refreshed (and cached ones ignored) this long before
+# they expire, so requests never go out with a token about to lapse
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "PUT", "DELETE"}
+MAX_RETRIES = 5
+RETRY_BASE_DELAY_SECONDS = 0.5
+RETRY_MAX_DELAY_SECONDS = 10.0
+# How long spreadsheet metadata and listings are reused before refetching
+METADATA_CACHE_TTL_SECONDS = 30
+# Base URL of each Google API the client talks to
+API_BASE_URLS = {
+    "sheets": "https://sheets.googleapis.com/v4",
+    "drive": "https://www.googleapis.com/drive/v3",
+}
+# Google only gzips responses when the User-Agent also mentions gzip
+COMPRESSION_HEADERS = {"Accept-Encoding": "gzip", "User-Agent": "sidekick-gsheets/1.0 (gzip)"}
+# Static part of every API request's headers; Authorization is added per token
+JSON_HEADERS = {"Accept": "application/json", **COMPRESSION_HEADERS}
+JSON_BODY_HEADERS = {**JSON_HEADERS, "Content-Type": "application/json"}
+# Shared compact encoder for request bodies; json.dumps would build a new
+# encoder on every call once non-default options are passed
+_JSON_BODY_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+# Chunk size used when streaming downloads to disk
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
+# Google rejects request bodies over 10MB; keep one-shot uploads safely below it
+MAX_REQUEST_BYTES = 9 * 1024 * 1024
+# Grid size of a new sheet; seeded sheets grow beyond it to fit their data
+DEFAULT_GRID_ROWS = 1000
+DEFAULT_GRID_COLUMNS = 26
+# Fields returned by create_spreadsheet, so seeded data isn't echoed back
+CREATE_RESPONSE_FIELDS = "spreadsheetId,spreadsheetUrl,properties,sheets.properties"
+# Spreadsheet ID segment of a docs.google.com/spreadsheets/d/<id>/... URL
+SPREADSHEET_ID_RE = re.compile(r"/spreadsheets/d/([a-zA-Z0-9_-]+)")
+# Characters besides the delimiter that make csv.writer quote a cell
+CSV_QUOTE_CHARS_RE = re.compile(r'["\r\n]')
+
+
 class GSheetsClient:
     """Google Sheets API client using native Python stdlib."""
 
-    def __init__(self, client_id: str, client_secret: str, refresh_token: str, timeout: int = 30):
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        refresh_token: str,
+        timeout: int = 30,
+        token_cache_path: Optional[Path] = TOKEN_CACHE_PATH,
+        metadata_cache_ttl: float = METADATA_CACHE_TTL_SECONDS
+    ):
         """Initialize Google Sheets client with OAuth2 credentials.
 
         Args:
@@ -21,13 +84,164 @@ class GSheetsClient:
             client_secret: OAuth2 client secret
             refresh_token: OAuth2 refresh token
             timeout: Request timeout in seconds
+            token_cache_path: File used to reuse access tokens across
+                processes (None disables the disk cache)
+            metadata_cache_ttl: Seconds to reuse get_spreadsheet and
+                list_spreadsheets results (0 disables the cache)
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.refresh_token = refresh_token
         self.timeout = timeout
+        self.token_cache_path = Path(token_cache_path) if token_cache_path else None
         self.access_token = None
+        self.access_token_expires_at = 0.0
+        # Request headers for the current access token, rebuilt on refresh
+        self._base_headers = None
+        self._body_headers = None
+        self._token_lock = threading.Lock()
         self.api_call_count = 0
+        self._count_lock = threading.Lock()
+        # Metadata keyed by spreadsheet ID and listings keyed by max_results,
+        # each stored as (fetched_at, result)
+        self.metadata_cache_ttl = metadata_cache_ttl
+        self._metadata_cache = {}
+        self._list_cache = {}
+        self._metadata_lock = threading.Lock()
+        # Idle keep-alive HTTPS connections keyed by host. Each request checks
+        # one out and returns it afterwards, so concurrent callers never share
+        # a socket and connections outlive the worker threads that used them
+        self._idle_connections = {}
+        self._connections_lock = threading.Lock()
+
+    def _checkout_connection(self, host: str) -> tuple:
+        """Take an idle keep-alive connection for a host, or open a new one.
+
+        Returns:
+            tuple of (connection: HTTPSConnection, reused: bool)
+        """
+        with self._connections_lock:
+            idle = self._idle_connections.get(host)
+            if idle:
+                return idle.pop(), True
+        return http.client.HTTPSConnection(host, timeout=self.timeout), False
+
+    def _return_connection(self, host: str, conn: http.client.HTTPSConnection) -> None:
+        """Put a connection back in the idle pool, closing it if the pool is full."""
+        with self._connections_lock:
+            idle = self._idle_connections.setdefault(host, [])
+            if len(idle) < MAX_IDLE_CONNECTIONS:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close all idle keep-alive connections."""
+        with self._connections_lock:
+            idle, self._idle_connections = self._idle_connections, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[dict] = None,
+        sink=None
+    ) -> tuple:
+        """Send an HTTP request over a reused keep-alive connection.
+
+        A connection that the server closed while idle is reopened and the
+        request is sent once more; any other failure is not retried.
+
+        Args:
+            sink: Binary file to stream a successful response body into
+                instead of reading it into memory
+
+        Returns:
+            tuple of (status: int, headers: HTTPMessage, body: bytes); body
+            is empty when a successful response was streamed into sink
+
+        Raises:
+            ConnectionError: For network errors
+        """
+        parts = urllib.parse.urlsplit(url)
+        path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        host = parts.netloc
+
+        for attempt in range(2):
+            conn, reused = self._checkout_connection(host)
+            streaming = False
+            try:
+                conn.request(method, path, body=body, headers=headers or {})
+                response = conn.getresponse()
+                gzipped = response.headers.get("Content-Encoding") == "gzip"
+                if sink is not None and response.status < 300:
+                    streaming = True
+                    stream = gzip.GzipFile(fileobj=response) if gzipped else response
+                    shutil.copyfileobj(stream, sink, DOWNLOAD_CHUNK_BYTES)
+                    # Drain anything after the gzip stream so the connection can be reused
+                    response.read()
+                    raw = b""
+                else:
+                    raw = response.read()
+                    if gzipped:
+                        raw = gzip.decompress(raw)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+                conn.close()
+                # Resending after part of the body reached sink would duplicate it
+                if reused and attempt == 0 and not streaming:
+                    continue
+                raise ConnectionError(f"Network error: {e}")
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                raise ConnectionError(f"Network error: {e}")
+            self._return_connection(host, conn)
+            return response.status, response.headers, raw
+
+    def _send_with_backoff(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[dict] = None,
+        sink=None
+    ) -> tuple:
+        """Send a request, retrying transient failures with exponential backoff.
+
+        5xx responses and network errors are retried only for idempotent
+        methods, since a POST or PATCH may already have applied; those are
+        retried only on 429, or on 503 when the server sends Retry-After.
+        A Retry-After header, when present, sets the delay.
+
+        Returns:
+            tuple of (status: int, headers: HTTPMessage, body: bytes) from the
+            last attempt
+
+        Raises:
+            ConnectionError: For network errors after the last attempt
+        """
+        sink_start = sink.tell() if sink is not None else None
+        for attempt in range(MAX_RETRIES + 1):
+            last_attempt = attempt == MAX_RETRIES
+            try:
+                status, response_headers, raw = self._send(method, url, body=body, headers=headers, sink=sink)
+            except ConnectionError:
+                if last_attempt or method not in IDEMPOTENT_METHODS:
+                    raise
+                delay = _backoff_delay(attempt)
+                if sink is not None:
+                    # Drop whatever part of the body was streamed before the failure
+                    sink.seek(sink_start)
+                    sink.truncate()
+            else:
+                retry_after = _parse_retry_after(response_headers.get("Retry-After"))
+                if last_attempt or not _is_retryable_status(method, status, retry_after):
+                    return status, response_headers, raw
+                delay = retry_after if retry_after is not None else _backoff_delay(attempt)
+            time.sleep(delay)
 
     def _refresh_access_token(self) -> str:
         """Refresh OAuth2 access token using refresh token.
@@ -47,24 +261,112 @@ class GSheetsClient:
         }
 
         encoded_data = urllib.parse.urlencode(data).encode()
-        req = urllib.request.Request(token_url, data=encoded_data, method="POST")
-        req.add_header("Content-Type", "application/x-www-form-urlencoded")
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
+        status, _, body = self._send("POST", token_url, body=encoded_data, headers=headers)
+        if status >= 400:
+            raise ValueError(f"Failed to refresh access token: {status} - {body.decode()}")
         try:
-            with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                result = json.loads(response.read().decode())
-                return result["access_token"]
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode() if e.fp else ""
-            raise ValueError(f"Failed to refresh access token: {e.code} - {error_body}")
+            result = json.loads(body)
+            access_token = result["access_token"]
         except (KeyError, json.JSONDecodeError) as e:
             raise ValueError(f"Invalid token response: {e}")
 
+        self.access_token_expires_at = time.time() + result.get("expires_in", 3600)
+        self._save_cached_token(access_token, self.access_token_expires_at)
+        return access_token
+
+    def _token_cache_key(self) -> str:
+        """Identify cached tokens by refresh token without storing it in the clear."""
+        return hashlib.sha256((self.refresh_token or "").encode()).hexdigest()[:16]
+
+    def _load_cached_token(self) -> Optional[str]:
+        """Load an access token from the disk cache if it is not about to expire."""
+        if not self.token_cache_path:
+            return None
+        try:
+            cached = json.loads(self.token_cache_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if cached.get("client_id") != self.client_id or cached.get("key") != self._token_cache_key():
+            return None
+        if cached.get("expires_at", 0) - TOKEN_EXPIRY_MARGIN_SECONDS <= time.time():
+            return None
+        self.access_token_expires_at = cached["expires_at"]
+        return cached.get("access_token")
+
+    def _save_cached_token(self, access_token: str, expires_at: float) -> None:
+        """Atomically write the access token to the disk cache (owner read/write only)."""
+        if not self.token_cache_path:
+            return
+        tmp_path = self.token_cache_path.with_name(f"{self.token_cache_path.name}.{os.getpid()}.tmp")
+        try:
+            self.token_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump({
+                    "client_id": self.client_id,
+                    "key": self._token_cache_key(),
+                    "access_token": access_token,
+                    "expires_at": expires_at,
+                }, f)
+            os.replace(tmp_path, self.token_cache_path)
+        except OSError:
+            # The cache is an optimization; a failed write just means a refresh next time
+            pass
+
+    def invalidate_token(self) -> None:
+        """Forget the current access token in memory and on disk."""
+        with self._token_lock:
+            self.access_token = None
+            self.access_token_expires_at = 0.0
+            self._base_headers = None
+            self._body_headers = None
+        if self.token_cache_path:
+            try:
+                self.token_cache_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _token_is_fresh(self) -> bool:
+        """Whether the in-memory token is set and not close to expiring."""
+        return bool(self.access_token) and time.time() < self.access_token_expires_at - TOKEN_EXPIRY_MARGIN_SECONDS
+
     def _get_access_token(self) -> str:
-        """Get valid access token, refreshing if necessary."""
-        if not self.access_token:
-            self.access_token = self._refresh_access_token()
-        return self.access_token
+        """Get valid access token, loading it from the disk cache or refreshing."""
+        with self._token_lock:
+            self._ensure_fresh_token()
+            return self.access_token
+
+    def _ensure_fresh_token(self) -> None:
+        """Load or refresh the access token if needed; callers hold _token_lock.
+
+        Concurrent callers share a single refresh, and nobody reads the token
+        or its headers while invalidate_token is clearing them.
+        """
+        if not self._token_is_fresh():
+            self._set_access_token(self._load_cached_token() or self._refresh_access_token())
+
+    def _set_access_token(self, access_token: str) -> None:
+        """Store a new access token and rebuild the request headers that carry it."""
+        authorization = {"Authorization": f"Bearer {access_token}"}
+        self._base_headers = {**authorization, **JSON_HEADERS}
+        self._body_headers = {**authorization, **JSON_BODY_HEADERS}
+        self.access_token = access_token
+
+    def _get_base_headers(self, has_body: bool = False) -> dict:
+        """Get the shared request headers for a valid access token.
+
+        The dict is reused across requests and must not be mutated.
+        """
+        with self._token_lock:
+            self._ensure_fresh_token()
+            return self._body_headers if has_body else self._base_headers
+
+    def _count_api_call(self) -> None:
+        """Increment api_call_count; requests may run on worker threads."""
+        with self._count_lock:
+            self.api_call_count += 1
 
     def _request(
         self,
@@ -72,9 +374,11 @@ class GSheetsClient:
         endpoint: str,
         params: Optional[dict] = None,
         json_data: Optional[dict] = None,
-        retry_auth: bool = True
+        retry_auth: bool = True,
+        body: Optional[bytes] = None,
+        service: str = "sheets"
     ) -> Optional[dict]:
-        """Make HTTP request to Google Sheets API.
+        """Make HTTP request to the Google Sheets or Drive API.
 
         Args:
             method: HTTP method (GET, POST, PUT, PATCH, DELETE)
@@ -82,6 +386,8 @@ class GSheetsClient:
             params: URL query parameters
             json_data: JSON body data
             retry_auth: Whether to retry once on auth failure
+            body: Pre-encoded JSON body, used instead of json_data
+            service: Key into API_BASE_URLS ("sheets" or "drive")
 
         Returns:
             Parsed JSON response as dict
@@ -92,107 +398,101 @@ class GSheetsClient:
             RuntimeError: For 5xx server errors
         """
         # Build URL
-        base_url = "https://sheets.googleapis.com/v4"
-        url = f"{base_url}{endpoint}"
+        url = API_BASE_URLS[service] + endpoint
         if params:
             url += "?" + urllib.parse.urlencode(params)
 
-        # Prepare request
-        headers = {
-            "Authorization": f"Bearer {self._get_access_token()}",
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
-        data = json.dumps(json_data).encode() if json_data else None
-        req = urllib.request.Request(url, data=data, headers=headers, method=method)
+        data = body if body is not None else _encode_json_body(json_data) if json_data else None
+        status, _, raw = self._send_with_backoff(
+            method, url, body=data, headers=self._get_base_headers(data is not None)
+        )
 
-        try:
-            with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                self.api_call_count += 1
-                body = response.read().decode()
-                if not body or body.strip() == "":
-                    return {}
-                return json.loads(body)
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode() if e.fp else ""
-
-            # Retry once on 401 (token might be expired)
-            if e.code == 401 and retry_auth:
-                self.access_token = None  # Force token refresh
-                return self._request(method, endpoint, params, json_data, retry_auth=False)
-
-            if e.code == 404:
-                raise ValueError(f"Resource not found: {endpoint}")
-            elif e.code >= 400 and e.code < 500:
-                raise ValueError(f"Client error {e.code}: {error_body}")
-            elif e.code >= 500:
-                raise RuntimeError(f"Server error {e.code}: {error_body}")
-            else:
-                raise ConnectionError(f"HTTP error {e.code}: {error_body}")
-        except urllib.error.URLError as e:
-            raise ConnectionError(f"Network error: {e.reason}")
+        # Retry once on 401 (token might be expired), reusing the encoded body
+        if status == 401 and retry_auth:
+            self.invalidate_token()  # Force token refresh
+            status, _, raw = self._send_with_backoff(
+                method, url, body=data, headers=self._get_base_headers(data is not None)
+            )
 
-    def _drive_request(
-        self,
-        method: str,
-        endpoint: str,
-        params: Optional[dict] = None,
-        retry_auth: bool = True
-    ) -> Optional[dict]:
-        """Make HTTP request to Google Drive API.
+        if status >= 300:
+            self._raise_for_status(status, endpoint, raw.decode())
+
+        self._count_api_call()
+        # json.loads accepts UTF-8 bytes, so skip the intermediate str copy
+        return json.loads(raw) if raw and not raw.isspace() else {}
+
+    def _drive_export_csv(self, spreadsheet_id: str, retry_auth: bool = True, sink=None) -> bytes:
+        """Export a spreadsheet's first sheet as CSV bytes via the Drive API.
+
+        Drive builds the CSV server-side, so there is no JSON to parse.
 
         Args:
-            method: HTTP method (GET, POST, etc.)
-            endpoint: API endpoint path
-            params: URL query parameters
+            spreadsheet_id: The spreadsheet ID
             retry_auth: Whether to retry once on auth failure
-
-        Returns:
-            Parsed JSON response as dict
+            sink: Binary file to stream the CSV into (returns b"" then)
 
         Raises:
             ConnectionError: For network errors
-            ValueError: For 4xx client errors
+            ValueError: For 4xx client errors (including exports over
+                Drive's size limit)
             RuntimeError: For 5xx server errors
         """
-        # Build URL
-        base_url = "https://www.googleapis.com/drive/v3"
-        url = f"{base_url}{endpoint}"
-        if params:
-            url += "?" + urllib.parse.urlencode(params)
-
-        # Prepare request
-        headers = {
-            "Authorization": f"Bearer {self._get_access_token()}",
-            "Accept": "application/json"
-        }
-        req = urllib.request.Request(url, headers=headers, method=method)
+        endpoint = f"/files/{urllib.parse.quote(spreadsheet_id, safe='')}/export"
+        url = f"{API_BASE_URLS['drive']}{endpoint}?mimeType=text%2Fcsv"
+        headers = {"Authorization": f"Bearer {self._get_access_token()}", **COMPRESSION_HEADERS}
+        status, _, raw = self._send_with_backoff("GET", url, headers=headers, sink=sink)
+
+        # Retry once on 401 (token might be expired)
+        if status == 401 and retry_auth:
+            self.invalidate_token()  # Force token refresh
+            headers["Authorization"] = f"Bearer {self._get_access_token()}"
+            status, _, raw = self._send_with_backoff("GET", url, headers=headers, sink=sink)
+
+        if status >= 300:
+            self._raise_for_status(status, endpoint, raw.decode())
+
+        self._count_api_call()
+        return raw
+
+    def _cache_get(self, cache: dict, key):
+        """Return a cached result if it is younger than the TTL."""
+        with self._metadata_lock:
+            entry = cache.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.metadata_cache_ttl:
+            return None
+        return entry[1]
+
+    def _cache_put(self, cache: dict, key, result) -> None:
+        """Store a result in a metadata cache."""
+        if self.metadata_cache_ttl > 0:
+            with self._metadata_lock:
+                cache[key] = (time.monotonic(), result)
+
+    def invalidate_metadata(self, spreadsheet_id: Optional[str] = None) -> None:
+        """Drop cached metadata after a write.
+
+        Listings are always dropped, since writes change modifiedTime.
 
-        try:
-            with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                self.api_call_count += 1
-                body = response.read().decode()
-                if not body or body.strip() == "":
-                    return {}
-                return json.loads(body)
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode() if e.fp else ""
-
-            # Retry once on 401 (token might be expired)
-            if e.code == 401 and retry_auth:
-                self.access_token = None  # Force token refresh
-                return self._drive_request(method, endpoint, params, retry_auth=False)
-
-            if e.code == 404:
-                raise ValueError(f"Resource not found: {endpoint}")
-            elif e.code >= 400 and e.code < 500:
-                raise ValueError(f"Client error {e.code}: {error_body}")
-            elif e.code >= 500:
-                raise RuntimeError(f"Server error {e.code}: {error_body}")
+        Args:
+            spreadsheet_id: Spreadsheet whose metadata changed (None drops all)
+        """
+        with self._metadata_lock:
+            if spreadsheet_id is None:
+                self._metadata_cache.clear()
             else:
-                raise ConnectionError(f"HTTP error {e.code}: {error_body}")
-        except urllib.error.URLError as e:
-            raise ConnectionError(f"Network error: {e.reason}")
+                self._metadata_cache.pop(spreadsheet_id, None)
+            self._list_cache.clear()
+
+    def _raise_for_status(self, status: int, endpoint: str, error_body: str) -> None:
+        """Raise the client's standard exception for an HTTP error status."""
+        if status == 404:
+            raise ValueError(f"Resource not found: {endpoint}")
+        elif status >= 400 and status < 500:
+            raise ValueError(f"Client error {status}: {error_body}")
+        elif status >= 500:
+            raise RuntimeError(f"Server error {status}: {error_body}")
+        else:
+            raise ConnectionError(f"HTTP error {status}: {error_body}")
 
     @staticmethod
     def extract_spreadsheet_id(url: str) -> str:
@@ -213,13 +513,10 @@ class GSheetsClient:
             ... )
             '1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms'
         """
-        if "/spreadsheets/d/" in url:
-            # Extract ID from URL
-            parts = url.split("/spreadsheets/d/")
-            if len(parts) > 1:
-                spreadsheet_id = parts[1].split("/")[0].split("?")[0].split("#")[0]
-                return spreadsheet_id
-        raise ValueError(f"Invalid Google Sheets URL: {url}")
+        match = SPREADSHEET_ID_RE.search(url)
+        if not match:
+            raise ValueError(f"Invalid Google Sheets URL: {url}")
+        return match.group(1)
 
     def list_spreadsheets(self, max_results: int = 100) -> List[dict]:
         """List all spreadsheets accessible to the user.
@@ -231,20 +528,27 @@ class GSheetsClient:
 
         Returns:
             List of spreadsheet dicts with id, name, and webViewLink
+            (cached for metadata_cache_ttl seconds)
 
         Example:
             >>> spreadsheets = client.list_spreadsheets(max_results=10)
             >>> for sheet in spreadsheets:
             ...     print(f"{sheet['name']}: {sheet['id']}")
         """
+        cached = self._cache_get(self._list_cache, max_results)
+        if cached is not None:
+            return cached
+
         params = {
             "q": "mimeType='application/vnd.google-apps.spreadsheet'",
             "pageSize": max_results,
             "fields": "files(id,name,webViewLink,modifiedTime)"
         }
 
-        result = self._drive_request("GET", "/files", params=params)
-        return result.get("files", [])
+        result = self._request("GET", "/files", params=params, service="drive")
+        files = result.get("files", [])
+        self._cache_put(self._list_cache, max_results, files)
+        return files
 
     def get_spreadsheet_by_url(self, url: str) -> dict:
         """Get spreadsheet metadata by URL.
@@ -273,9 +577,28 @@ class GSheetsClient:
             spreadsheet_id: The spreadsheet ID
 
         Returns:
-            Spreadsheet metadata dict
+            Spreadsheet metadata dict (cached for metadata_cache_ttl seconds)
         """
-        return self._request("GET", f"/spreadsheets/{spreadsheet_id}")
+        cached = self._cache_get(self._metadata_cache, spreadsheet_id)
+        if cached is not None:
+            return cached
+
+        result = self._request("GET", f"/spreadsheets/{spreadsheet_id}")
+        self._cache_put(self._metadata_cache, spreadsheet_id, result)
+        return result
+
+    def _first_sheet_title(self, spreadsheet_id: str) -> Optional[str]:
+        """Get the title of the first sheet (the one Drive exports)."""
+        result = self._request(
+            "GET",
+            f"/spreadsheets/{spreadsheet_id}",
+            params={"fields": "sheets.properties(title,index)"}
+        )
+        for sheet in result.get("sheets", []):
+            props = sheet.get("properties", {})
+            if props.get("index", 0) == 0:
+                return props.get("title")
+        return None
 
     def get_values(
         self,
@@ -300,28 +623,33 @@ class GSheetsClient:
     def download_as_csv(
         self,
         spreadsheet_id: str,
-        sheet_name: str = "Sheet1",
+        sheet_name: Optional[str] = None,
         output_path: Optional[str] = None
     ) -> str:
         """Download a sheet as CSV.
 
+        Use download_csv_to_file to save a large sheet without holding it
+        in memory.
+
         Args:
             spreadsheet_id: The spreadsheet ID
-            sheet_name: Name of the sheet to download
-            output_path: Path to save CSV (if None, returns CSV string)
+            sheet_name: Name of the sheet to download (default: the first sheet)
+            output_path: Path to also save the CSV to
 
         Returns:
             CSV content as string
         """
-        values = self.get_values(spreadsheet_id, sheet_name)
-
-        # Convert to CSV
-        output = StringIO()
-        writer = csv.writer(output)
-        for row in values:
-            writer.writerow(row)
-
-        csv_content = output.getvalue()
+        csv_content = None
+        if sheet_name is None:
+            # Drive exports the first sheet as CSV directly, with no JSON to parse
+            try:
+                csv_content = self._drive_export_csv(spreadsheet_id).decode("utf-8")
+            except ValueError:
+                # e.g. the export exceeds Drive's size limit
+                sheet_name = self._first_sheet_title(spreadsheet_id) or "Sheet1"
+
+        if csv_content is None:
+            csv_content = "".join(_iter_csv_lines(self.get_values(spreadsheet_id, sheet_name)))
 
         # Save to file if path provided
         if output_path:
@@ -330,21 +658,63 @@ class GSheetsClient:
 
         return csv_content
 
-    def create_spreadsheet(self, title: str) -> dict:
+    def download_csv_to_file(
+        self,
+        spreadsheet_id: str,
+        output_path: str,
+        sheet_name: Optional[str] = None
+    ) -> None:
+        """Download a sheet as CSV straight to a file.
+
+        The CSV is never built up as one string: Drive's export is streamed
+        to disk, and values.get rows are written one line at a time.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            output_path: Path to save the CSV to
+            sheet_name: Name of the sheet to download (default: the first sheet)
+        """
+        if sheet_name is None:
+            try:
+                with open(output_path, "wb") as f:
+                    self._drive_export_csv(spreadsheet_id, sink=f)
+                return
+            except ValueError:
+                # e.g. the export exceeds Drive's size limit
+                sheet_name = self._first_sheet_title(spreadsheet_id) or "Sheet1"
+
+        values = self.get_values(spreadsheet_id, sheet_name)
+        with open(output_path, "w", newline="", encoding="utf-8") as f:
+            f.writelines(_iter_csv_lines(values))
+
+    def create_spreadsheet(
+        self,
+        title: str,
+        sheet_name: Optional[str] = None,
+        values: Optional[List[List[str]]] = None
+    ) -> dict:
         """Create a new spreadsheet.
 
         Args:
             title: Title for the new spreadsheet
+            sheet_name: Name for the first sheet (default: Google's "Sheet1")
+            values: 2D list of cell values to seed the first sheet with,
+                stored as-is like valueInputOption=RAW
 
         Returns:
             Spreadsheet metadata dict with spreadsheetId
         """
-        request_body = {
-            "properties": {
-                "title": title
-            }
-        }
-        return self._request("POST", "/spreadsheets", json_data=request_body)
+        # A new file changes the listing
+        self.invalidate_metadata()
+        if sheet_name is None and values is None:
+            return self._request(
+                "POST",
+                "/spreadsheets",
+                params={"fields": CREATE_RESPONSE_FIELDS},
+                json_data={"properties": {"title": title}}
+            )
+        body = _encode_create_body(title, sheet_name or "Sheet1", values or [])
+        return self._request("POST", "/spreadsheets", params={"fields": CREATE_RESPONSE_FIELDS}, body=body)
 
     def upload_csv(
         self,
@@ -362,10 +732,13 @@ class GSheetsClient:
         Returns:
             Spreadsheet metadata dict with spreadsheetId
         """
-        # Read CSV file
-        with open(csv_path, "r", newline="", encoding="utf-8") as f:
-            reader = csv.reader(f)
-            values = list(reader)
+        # Create the spreadsheet, named sheet and data in one call when the
+        # request fits under Google's body size limit. Rows are encoded as
+        # they are read so the CSV is never held as lists of strings.
+        body = _encode_create_body(title, sheet_name, _iter_csv_rows(csv_path), MAX_REQUEST_BYTES)
+        if body is not None:
+            self.invalidate_metadata()
+            return self._request("POST", "/spreadsheets", params={"fields": CREATE_RESPONSE_FIELDS}, body=body)
 
         # Create new spreadsheet
         spreadsheet = self.create_spreadsheet(title)
@@ -389,8 +762,8 @@ class GSheetsClient:
                 }
             )
 
-        # Write data
-        self.update_values(spreadsheet_id, sheet_name, values)
+        # Write data (also drops the metadata cached before the rename)
+        self.update_values_chunked(spreadsheet_id, sheet_name, _iter_csv_rows(csv_path))
 
         return spreadsheet
 
@@ -410,14 +783,115 @@ class GSheetsClient:
         Returns:
             Update response dict
         """
-        request_body = {
-            "values": values
-        }
+        return self._put_values(spreadsheet_id, range_name, _encode_values_body(values))
+
+    def _put_values(self, spreadsheet_id: str, range_name: str, body: bytes) -> dict:
+        """Write a pre-encoded {"values": [...]} body to a range."""
+        self.invalidate_metadata(spreadsheet_id)
         return self._request(
             "PUT",
-            f"/spreadsheets/{spreadsheet_id}/values/{range_name}",
+            f"/spreadsheets/{spreadsheet_id}/values/{urllib.parse.quote(range_name, safe='')}",
             params={"valueInputOption": "RAW"},
-            json_data=request_body
+            body=body
+        )
+
+    def update_values_chunked(
+        self,
+        spreadsheet_id: str,
+        sheet_name: str,
+        values: Iterable[List[str]],
+        chunk_rows: int = CHUNK_ROWS,
+        max_workers: int = CHUNK_MAX_WORKERS
+    ) -> dict:
+        """Write rows to a sheet from A1 in row shards sent concurrently.
+
+        Each shard of chunk_rows rows is its own values.update call, which
+        keeps request bodies under Google's 10MB limit and lets the shards
+        upload in parallel. Unlike update_values this is not atomic: if one
+        shard fails, others may already have been written.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            sheet_name: Name of the sheet to write
+            values: Rows of cell values (any iterable, e.g. a CSV reader)
+            chunk_rows: Rows per request
+            max_workers: Maximum number of shards sent at once
+
+        Returns:
+            Update response dict with updatedRows, updatedColumns and
+            updatedCells summed over the shards' responses
+        """
+        shards, row_count, column_count = _encode_values_shards(values, chunk_rows)
+        return self._write_shards(spreadsheet_id, sheet_name, shards, row_count, column_count, max_workers)
+
+    def _write_shards(
+        self,
+        spreadsheet_id: str,
+        sheet_name: str,
+        shards: List[Tuple[int, bytearray]],
+        row_count: int,
+        column_count: int,
+        max_workers: int = CHUNK_MAX_WORKERS
+    ) -> dict:
+        """Send encoded (first_row, body) shards and merge their responses."""
+        if len(shards) <= 1:
+            body = shards[0][1] if shards else _encode_values_body([])
+            return self._put_values(spreadsheet_id, sheet_name, body)
+
+        # A shard can only start at a cell inside the grid
+        self._ensure_grid_size(spreadsheet_id, sheet_name, row_count, column_count)
+
+        start_cell = "'" + sheet_name.replace("'", "''") + "'!A{}"
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(shards))) as executor:
+            futures = [
+                executor.submit(self._put_values, spreadsheet_id, start_cell.format(first_row + 1), body)
+                for first_row, body in shards
+            ]
+            responses = [future.result() for future in futures]
+
+        return {
+            "spreadsheetId": spreadsheet_id,
+            "updatedRows": sum(r.get("updatedRows", 0) for r in responses),
+            "updatedColumns": max(r.get("updatedColumns", 0) for r in responses),
+            "updatedCells": sum(r.get("updatedCells", 0) for r in responses),
+            "responses": responses
+        }
+
+    def _ensure_grid_size(self, spreadsheet_id: str, sheet_name: str, row_count: int, column_count: int) -> None:
+        """Grow a sheet's grid to at least row_count x column_count."""
+        result = self._request(
+            "GET",
+            f"/spreadsheets/{spreadsheet_id}",
+            params={"fields": "sheets.properties(sheetId,title,gridProperties)"}
+        )
+        for sheet in result.get("sheets", []):
+            props = sheet.get("properties", {})
+            if props.get("title") == sheet_name:
+                break
+        else:
+            raise ValueError(f"Sheet not found: {sheet_name}")
+
+        grid = props.get("gridProperties", {})
+        rows = max(grid.get("rowCount", 0), row_count)
+        columns = max(grid.get("columnCount", 0), column_count)
+        if rows == grid.get("rowCount") and columns == grid.get("columnCount"):
+            return
+
+        self.invalidate_metadata(spreadsheet_id)
+        self._request(
+            "POST",
+            f"/spreadsheets/{spreadsheet_id}:batchUpdate",
+            json_data={
+                "requests": [{
+                    "updateSheetProperties": {
+                        "properties": {
+                            "sheetId": props.get("sheetId", 0),
+                            "gridProperties": {"rowCount": rows, "columnCount": columns}
+                        },
+                        "fields": "gridProperties(rowCount,columnCount)"
+                    }
+                }]
+            }
         )
 
     def clear_sheet(self, spreadsheet_id: str, range_name: str = "Sheet1") -> dict:
@@ -430,9 +904,10 @@ class GSheetsClient:
         Returns:
             Clear response dict
         """
+        self.invalidate_metadata(spreadsheet_id)
         return self._request(
             "POST",
-            f"/spreadsheets/{spreadsheet_id}/values/{range_name}:clear"
+            f"/spreadsheets/{spreadsheet_id}/values/{urllib.parse.quote(range_name, safe='')}:clear"
         )
 
     def replace_sheet_with_csv(
@@ -449,18 +924,187 @@ class GSheetsClient:
             sheet_name: Name of the sheet to replace
 
         Returns:
-            Update response dict
+            Update response dict (see update_values_chunked for large files)
         """
-        # Read CSV file
-        with open(csv_path, "r", newline="", encoding="utf-8") as f:
-            reader = csv.reader(f)
-            values = list(reader)
+        # Encode rows as they are read so the CSV is never held as lists of
+        # strings, and before clearing so a bad file leaves the sheet intact
+        shards, row_count, column_count = _encode_values_shards(_iter_csv_rows(csv_path), CHUNK_ROWS)
 
         # Clear existing data
         self.clear_sheet(spreadsheet_id, sheet_name)
 
         # Write new data
-        return self.update_values(spreadsheet_id, sheet_name, values)
+        return self._write_shards(spreadsheet_id, sheet_name, shards, row_count, column_count)
+
+    def replace_sheets_with_csvs(
+        self,
+        spreadsheet_id: str,
+        csv_paths: dict,
+        max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> dict:
+        """Replace several sheets' contents with CSV data concurrently.
+
+        Each sheet is cleared and rewritten on its own worker thread, so
+        the round-trips for different sheets overlap.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            csv_paths: Dict mapping sheet name to CSV file path
+            max_workers: Maximum number of sheets replaced at once
+
+        Returns:
+            Dict mapping sheet name to its update response dict
+
+        Raises:
+            The first error raised while replacing any sheet
+        """
+        if not csv_paths:
+            return {}
+
+        # Refresh the token once up front rather than in every worker
+        self._get_access_token()
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(csv_paths))) as executor:
+            futures = {
+                sheet_name: executor.submit(self.replace_sheet_with_csv, spreadsheet_id, csv_path, sheet_name)
+                for sheet_name, csv_path in csv_paths.items()
+            }
+            return {sheet_name: future.result() for sheet_name, future in futures.items()}
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff delay with jitter for a zero-based retry attempt."""
+    return min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * 2 ** attempt) + random.uniform(0, 1)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def _is_retryable_status(method: str, status: int, retry_after: Optional[float]) -> bool:
+    """Check whether a response status may be retried for this method."""
+    if status not in RETRY_STATUSES:
+        return False
+    if method in IDEMPOTENT_METHODS or status == 429:
+        return True
+    return status == 503 and retry_after is not None
+
+
+def _encode_json_body(data) -> bytes:
+    """Encode a request body as compact UTF-8 JSON."""
+    return _JSON_BODY_ENCODER.encode(data).encode("utf-8")
+
+
+def _iter_csv_rows(csv_path: str) -> Iterator[List[str]]:
+    """Yield the rows of a CSV file one at a time."""
+    with open(csv_path, "r", newline="", encoding="utf-8") as f:
+        yield from csv.reader(f)
+
+
+def _iter_csv_lines(rows: Iterable[List[str]]) -> Iterator[str]:
+    """Yield each row as a CSV line, identical to csv.writer's output.
+
+    Rows with no cell needing quotes are joined directly; only the rest go
+    through csv.writer.
+    """
+    output = StringIO()
+    writer = csv.writer(output)
+    for row in rows:
+        line = ",".join(row)
+        # An extra comma means a cell contains one; an empty line would need
+        # csv.writer's "" for a single empty cell
+        if line and line.count(",") == len(row) - 1 and not CSV_QUOTE_CHARS_RE.search(line):
+            yield line + "\r\n"
+        else:
+            writer.writerow(row)
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate()
+
+
+def _encode_values_body(rows: Iterable[List[str]]) -> bytearray:
+    """Encode rows as a {"values": [...]} request body, one row at a time."""
+    body = bytearray(b'{"values":[')
+    for index, row in enumerate(rows):
+        if index:
+            body += b","
+        body += _JSON_BODY_ENCODER.encode(row).encode("utf-8")
+    body += b"]}"
+    return body
+
+
+def _encode_values_shards(
+    rows: Iterable[List[str]],
+    chunk_rows: int
+) -> Tuple[List[Tuple[int, bytearray]], int, int]:
+    """Encode rows as values bodies of up to chunk_rows rows each.
+
+    Returns:
+        tuple of ([(first_row_index, body), ...], row_count, column_count)
+    """
+    shards = []
+    row_count = 0
+    column_count = 0
+    rows = iter(rows)
+    while True:
+        chunk = list(itertools.islice(rows, chunk_rows))
+        if not chunk:
+            break
+        shards.append((row_count, _encode_values_body(chunk)))
+        row_count += len(chunk)
+        column_count = max(column_count, max(map(len, chunk)))
+    return shards, row_count, column_count
+
+
+def _encode_create_body(
+    title: str,
+    sheet_name: str,
+    rows: Iterable[List[str]],
+    max_bytes: Optional[int] = None
+) -> Optional[bytearray]:
+    """Encode a spreadsheets.create body whose first sheet is seeded with rows.
+
+    Cells are sent as stringValue, which stores them as-is like
+    valueInputOption=RAW, and the grid is sized to fit the data.
+
+    Returns:
+        The encoded body, or None once it grows past max_bytes
+    """
+    row_data = bytearray(b"[")
+    row_count = 0
+    column_count = 0
+    for row in rows:
+        if row_count:
+            row_data += b","
+        row_data += _JSON_BODY_ENCODER.encode(
+            {"values": [{"userEnteredValue": {"stringValue": cell}} for cell in row]}
+        ).encode("utf-8")
+        row_count += 1
+        column_count = max(column_count, len(row))
+        if max_bytes is not None and len(row_data) > max_bytes:
+            return None
+    row_data += b"]"
+
+    sheet_properties = {"title": sheet_name}
+    if row_count:
+        sheet_properties["gridProperties"] = {
+            "rowCount": max(DEFAULT_GRID_ROWS, row_count),
+            "columnCount": max(DEFAULT_GRID_COLUMNS, column_count)
+        }
+    body = bytearray(b'{"properties":')
+    body += _encode_json_body({"title": title})
+    body += b',"sheets":[{"properties":'
+    body += _encode_json_body(sheet_properties)
+    if row_count:
+        body += b',"data":[{"startRow":0,"startColumn":0,"rowData":'
+        body += row_data
+        body += b"}]"
+    body += b"}]}"
+    return body
 
 
 def main():
@@ -524,15 +1168,15 @@ def main():
                 sys.exit(1)
 
             spreadsheet_id = sys.argv[2]
-            sheet_name = sys.argv[3] if len(sys.argv) > 3 else "Sheet1"
+            sheet_name = sys.argv[3] if len(sys.argv) > 3 else None
             output_path = sys.argv[4] if len(sys.argv) > 4 else None
 
-            csv_content = client.download_as_csv(spreadsheet_id, sheet_name, output_path)
-
             if output_path:
-                print(f"Downloaded sheet '{sheet_name}' to {output_path}")
+                client.download_csv_to_file(spreadsheet_id, output_path, sheet_name)
+                label = f"sheet '{sheet_name}'" if sheet_name else "the first sheet"
+                print(f"Downloaded {label} to {output_path}")
             else:
-                print(csv_content)
+                print(client.download_as_csv(spreadsheet_id, sheet_name))
 
         elif command == "download-url":
             if len(sys.argv) < 3:
@@ -540,16 +1184,16 @@ def main():
                 sys.exit(1)
 
             url = sys.argv[2]
-            sheet_name = sys.argv[3] if len(sys.argv) > 3 else "Sheet1"
+            sheet_name = sys.argv[3] if len(sys.argv) > 3 else None
             output_path = sys.argv[4] if len(sys.argv) > 4 else None
 
             spreadsheet_id = client.extract_spreadsheet_id(url)
-            csv_content = client.download_as_csv(spreadsheet_id, sheet_name, output_path)
-
             if output_path:
-                print(f"Downloaded sheet '{sheet_name}' to {output_path}")
+                client.download_csv_to_file(spreadsheet_id, output_path, sheet_name)
+                label = f"sheet '{sheet_name}'" if sheet_name else "the first sheet"
+                print(f"Downloaded {label} to {output_path}")
             else:
-                print(csv_content)
+                print(client.download_as_csv(spreadsheet_id, sheet_name))
 
         elif command == "upload":
             if len(sys.argv) < 4:
@@ -623,6 +1267,8 @@ def main():
     except FileNotFoundError as e:
         print(f"Error: File not found - {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        client.close()
 
 
 if __name__ == "__main__":
@@ -4,17 +4,69 @@ import os
 import sys
 import json
 import base64
+import gzip
+import http.client
+import itertools
+import random
+import re
+import threading
 import time
-import urllib.request
 import urllib.parse
-import urllib.error
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 
+DEFAULT_MAX_WORKERS = 8
+# Idle keep-alive connections kept between requests
+MAX_IDLE_CONNECTIONS = DEFAULT_MAX_WORKERS
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "PUT", "DELETE"}
+MAX_RETRIES = 5
+RETRY_BASE_DELAY_SECONDS = 0.5
+RETRY_MAX_DELAY_SECONDS = 10.0
+# Issue JSON compresses well; only gzip is advertised so that's all we decode
+COMPRESSION_HEADERS = {"Accept-Encoding": "gzip"}
+# How long get_issue results are reused before refetching
+ISSUE_CACHE_TTL_SECONDS = 60
+# Issues kept in the per-client get_issue cache (least recently used evicted)
+ISSUE_CACHE_SIZE = 4096
+# Keys per `key IN (...)` search in get_issues_bulk
+BULK_BATCH_SIZE = 100
+# Parents per `parent IN (...)` search in get_issue_hierarchy
+CHILDREN_BATCH_SIZE = 50
+# Issues per page when a search is read to the end
+SEARCH_PAGE_SIZE = 100
+# Progress lines buffered before each stdout write in label_roadmap_hierarchy
+PROGRESS_FLUSH_EVERY = 32
+# Fields shown by the issue list and hierarchy output (description is left out:
+# it can be a multi-KB document per issue and only get-issue prints it)
+DISPLAY_FIELDS = ["key", "summary", "status", "assignee", "labels", "issuetype"]
+DISPLAY_FIELDS_PARAM = ",".join(DISPLAY_FIELDS)
+# Fields get_issue_hierarchy needs to follow links and children
+HIERARCHY_FIELDS = DISPLAY_FIELDS + ["issuelinks", "parent"]
+# Fields label_roadmap_hierarchy reads from each issue in the hierarchy
+ROADMAP_FIELDS = ["key", "summary", "labels", "issuelinks", "parent", "issuetype"]
+# Jira's built-in clone link type; other names fall back to a substring check
+CLONE_LINK_TYPE_NAMES = frozenset({"Cloners"})
+# Roadmap prefix at the start of a summary, e.g. "C1", "C1.5" or "C1.5.1"
+ROADMAP_PREFIX_RE = re.compile(r'^([A-Z]\d+(?:\.\d+)*)\s*\.?\s*')
+# Request bodies are compact UTF-8 JSON; one encoder is shared by all requests
+_JSON_BODY_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
 class JiraClient:
     """JIRA API client using native Python stdlib."""
 
-    def __init__(self, base_url: str, email: str, api_token: str, timeout: int = 30):
+    def __init__(
+        self,
+        base_url: str,
+        email: str,
+        api_token: str,
+        timeout: int = 30,
+        issue_cache_ttl: float = ISSUE_CACHE_TTL_SECONDS,
+        issue_cache_size: int = ISSUE_CACHE_SIZE
+    ):
         """Initialize JIRA client with basic auth.
 
         Args:
@@ -22,23 +74,144 @@ class JiraClient:
             email: User email for authentication
             api_token: API token for authentication
             timeout: Request timeout in seconds
+            issue_cache_ttl: Seconds to reuse get_issue results (0 disables the cache)
+            issue_cache_size: Maximum number of get_issue results kept (0 disables the cache)
         """
         self.base_url = base_url.rstrip('/')
+        parts = urllib.parse.urlsplit(self.base_url)
+        self._scheme = parts.scheme
+        self._host = parts.netloc
+        self._base_path = parts.path
         self.email = email
         self.api_token = api_token
         self.timeout = timeout
+        # Credentials don't change, so the Basic Auth headers are built once
+        credentials = base64.b64encode(f"{email}:{api_token}".encode()).decode()
+        self._auth_headers = {
+            "Authorization": f"Basic {credentials}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            **COMPRESSION_HEADERS
+        }
         self.api_version = "3"  # JIRA Cloud API v3
         self.api_call_count = 0  # Track API calls for debugging
+        self._count_lock = threading.Lock()
+        # get_issue results keyed by (issue key, requested fields), stored as
+        # (fetched_at, issue); update_issue drops the entries for the issue it changes
+        self.issue_cache_ttl = issue_cache_ttl
+        self.issue_cache_size = issue_cache_size
+        self._issue_cache = OrderedDict()
+        self._issue_cache_lock = threading.Lock()
+        # Idle keep-alive connections to the JIRA host. Each request checks one
+        # out and returns it afterwards, so concurrent callers never share a
+        # socket and connections outlive the worker threads that used them
+        self._idle_connections = []
+        self._connections_lock = threading.Lock()
+
+    def _checkout_connection(self) -> tuple:
+        """Take an idle keep-alive connection, or open a new one.
+
+        Returns:
+            tuple of (connection: HTTPConnection, reused: bool)
+        """
+        with self._connections_lock:
+            if self._idle_connections:
+                return self._idle_connections.pop(), True
+        if self._scheme == "http":
+            return http.client.HTTPConnection(self._host, timeout=self.timeout), False
+        return http.client.HTTPSConnection(self._host, timeout=self.timeout), False
+
+    def _return_connection(self, conn: http.client.HTTPConnection) -> None:
+        """Put a connection back in the idle pool, closing it if the pool is full."""
+        with self._connections_lock:
+            if len(self._idle_connections) < MAX_IDLE_CONNECTIONS:
+                self._idle_connections.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close all idle keep-alive connections."""
+        with self._connections_lock:
+            connections, self._idle_connections = self._idle_connections, []
+        for conn in connections:
+            conn.close()
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[dict] = None
+    ) -> tuple:
+        """Send an HTTP request over a reused keep-alive connection.
+
+        A connection that the server closed while idle is reopened and the
+        request is sent once more; any other failure is not retried.
+
+        Returns:
+            tuple of (status: int, headers: HTTPMessage, body: bytes)
+
+        Raises:
+            ConnectionError: For network errors
+        """
+        for attempt in range(2):
+            conn, reused = self._checkout_connection()
+            try:
+                conn.request(method, path, body=body, headers=headers or {})
+                response = conn.getresponse()
+                raw = response.read()
+                if response.headers.get("Content-Encoding") == "gzip":
+                    raw = gzip.decompress(raw)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise ConnectionError(f"Network error: {e}")
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                raise ConnectionError(f"Network error: {e}")
+            self._return_connection(conn)
+            return response.status, response.headers, raw
+
+    def _send_with_backoff(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[dict] = None
+    ) -> tuple:
+        """Send a request, retrying transient failures with exponential backoff.
+
+        5xx responses and network errors are retried only for idempotent
+        methods, since a POST or PATCH may already have applied; those are
+        retried only on 429, or on 503 when the server sends Retry-After.
+        A Retry-After header, when present, sets the delay.
+
+        Returns:
+            tuple of (status: int, headers: HTTPMessage, body: bytes) from the
+            last attempt
+
+        Raises:
+            ConnectionError: For network errors after the last attempt
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            last_attempt = attempt == MAX_RETRIES
+            try:
+                status, response_headers, raw = self._send(method, path, body=body, headers=headers)
+            except ConnectionError:
+                if last_attempt or method not in IDEMPOTENT_METHODS:
+                    raise
+                delay = _backoff_delay(attempt)
+            else:
+                retry_after = _parse_retry_after(response_headers.get("Retry-After"))
+                if last_attempt or not _is_retryable_status(method, status, retry_after):
+                    return status, response_headers, raw
+                delay = retry_after if retry_after is not None else _backoff_delay(attempt)
+            time.sleep(delay)
 
     def _get_auth_headers(self) -> dict:
-        """Generate Basic Auth headers."""
-        credentials = f"{self.email}:{self.api_token}"
-        encoded = base64.b64encode(credentials.encode()).decode()
-        return {
-            "Authorization": f"Basic {encoded}",
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
+        """Return the Basic Auth headers (shared; callers must not mutate them)."""
+        return self._auth_headers
 
     def _request(
         self,
@@ -64,60 +237,71 @@ class JiraClient:
             RuntimeError: For 5xx server errors
         """
         # Build URL
-        url = f"{self.base_url}{endpoint}"
+        path = f"{self._base_path}{endpoint}"
         if params:
-            url += "?" + urllib.parse.urlencode(params)
+            path += "?" + urllib.parse.urlencode(params, doseq=True, quote_via=urllib.parse.quote)
 
         # Prepare request
         headers = self._get_auth_headers()
-        data = json.dumps(json_data).encode() if json_data else None
-        req = urllib.request.Request(url, data=data, headers=headers, method=method)
+        data = _encode_json_body(json_data) if json_data else None
+        status, _, body = self._send_with_backoff(method, path, body=data, headers=headers)
 
-        try:
-            with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                self.api_call_count += 1
-                body = response.read().decode()
-                # Some API calls (like update operations) return no content
-                if not body or body.strip() == "":
-                    return None
-                return json.loads(body)
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode() if e.fp else ""
-            if e.code == 404:
-                raise ValueError(f"Resource not found: {url}")
-            elif e.code == 401 or e.code == 403:
-                # Parse error details for better messaging
-                error_message = "Authentication failed"
-                try:
-                    error_data = json.loads(error_body) if error_body else {}
-                    error_messages = error_data.get("errorMessages", [])
-                    if error_messages:
-                        error_message = ", ".join(error_messages)
-                except (json.JSONDecodeError, KeyError):
-                    pass
-
-                # Provide actionable error message for expired/invalid tokens
-                raise ValueError(
-                    f"JIRA authentication failed (HTTP {e.code}): {error_message}\n"
-                    f"\n"
-                    f"Your JIRA access token may be expired or invalid.\n"
-                    f"To fix this:\n"
-                    f"  1. Generate a new API token at: https://id.atlassian.com/manage-profile/security/api-tokens\n"
-                    f"  2. Update the JIRA_API_TOKEN in your .env file\n"
-                    f"  3. Verify your JIRA_EMAIL matches the account that created the token"
-                )
-            elif 400 <= e.code < 500:
-                raise ValueError(f"Client error {e.code}: {error_body}")
-            else:
-                raise RuntimeError(f"Server error {e.code}: {error_body}")
-        except urllib.error.URLError as e:
-            raise ConnectionError(f"Network error: {e.reason}")
+        if status >= 300:
+            self._raise_for_status(status, f"{self._scheme}://{self._host}{path}", body)
+
+        with self._count_lock:
+            self.api_call_count += 1
+        # Some API calls (like update operations) return no content
+        if not body or body.isspace():
+            return None
+        # json.loads accepts UTF-8 bytes, so skip the intermediate str copy
+        return json.loads(body)
+
+    def _raise_for_status(self, status: int, url: str, body: bytes) -> None:
+        """Raise the client's standard exception for an HTTP error status.
+
+        The raw body is only decoded for the statuses whose message includes it.
+        """
+        if status == 404:
+            raise ValueError(f"Resource not found: {url}")
+        elif status == 401 or status == 403:
+            # Parse error details for better messaging
+            error_message = "Authentication failed"
+            try:
+                error_data = json.loads(body) if body else {}
+                error_messages = error_data.get("errorMessages", [])
+                if error_messages:
+                    error_message = ", ".join(error_messages)
+            except (json.JSONDecodeError, UnicodeDecodeError, KeyError):
+                pass
 
-    def get_issue(self, issue_key: str) -> dict:
+            # Provide actionable error message for expired/invalid tokens
+            raise ValueError(
+                f"JIRA authentication failed (HTTP {status}): {error_message}\n"
+                f"\n"
+                f"Your JIRA access token may be expired or invalid.\n"
+                f"To fix this:\n"
+                f"  1. Generate a new API token at: https://id.atlassian.com/manage-profile/security/api-tokens\n"
+                f"  2. Update the JIRA_API_TOKEN in your .env file\n"
+                f"  3. Verify your JIRA_EMAIL matches the account that created the token"
+            )
+        error_body = body.decode(errors="replace")
+        if 400 <= status < 500:
+            raise ValueError(f"Client error {status}: {error_body}")
+        elif status >= 500:
+            raise RuntimeError(f"Server error {status}: {error_body}")
+        else:
+            raise ConnectionError(f"HTTP error {status}: {error_body}")
+
+    def get_issue(self, issue_key: str, fields: Optional[list] = None) -> dict:
         """Get a single issue by key (e.g., PROJ-123).
 
+        Results are cached for issue_cache_ttl seconds; at most issue_cache_size
+        results are kept, least recently used evicted first.
+
         Args:
             issue_key: Issue key like "PROJ-123"
+            fields: List of fields to return (all fields if not specified)
 
         Returns:
             dict with issue data including:
@@ -127,33 +311,122 @@ class JiraClient:
         Raises:
             ValueError: If issue not found or invalid key
         """
+        fields_param = ",".join(fields) if fields else None
+        cache_key = (issue_key, fields_param)
+        with self._issue_cache_lock:
+            entry = self._issue_cache.get(cache_key)
+            if entry is not None:
+                self._issue_cache.move_to_end(cache_key)
+        if entry is not None and time.monotonic() - entry[0] < self.issue_cache_ttl:
+            return entry[1]
+
         endpoint = f"/rest/api/{self.api_version}/issue/{issue_key}"
-        return self._request("GET", endpoint)
+        params = {"fields": fields_param} if fields_param else None
+        issue = self._request("GET", endpoint, params=params)
+        if self.issue_cache_ttl > 0 and self.issue_cache_size > 0:
+            with self._issue_cache_lock:
+                self._issue_cache[cache_key] = (time.monotonic(), issue)
+                self._issue_cache.move_to_end(cache_key)
+                while len(self._issue_cache) > self.issue_cache_size:
+                    self._issue_cache.popitem(last=False)
+        return issue
+
+    def invalidate_issue(self, issue_key: Optional[str] = None) -> None:
+        """Drop a cached get_issue result (or all of them when issue_key is None)."""
+        with self._issue_cache_lock:
+            if issue_key is None:
+                self._issue_cache.clear()
+            else:
+                for cache_key in [k for k in self._issue_cache if k[0] == issue_key]:
+                    del self._issue_cache[cache_key]
+
+    def get_issues_bulk(
+        self,
+        issue_keys: list,
+        fields: Optional[list] = None,
+        batch_size: int = BULK_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> list:
+        """Get multiple issues by keys with one JQL search per batch of keys.
 
-    def get_issues_bulk(self, issue_keys: list) -> list:
-        """Get multiple issues by keys.
+        Keys a search doesn't return (missing issues, or issues that moved to
+        another project and now have a new key) are fetched one by one.
 
         Args:
             issue_keys: List of issue keys like ["PROJ-123", "PROJ-124"]
+            fields: List of fields to return (all fields if not specified)
+            batch_size: Maximum number of keys per search
+            max_workers: Maximum number of batch searches (or per-issue
+                requests, when keys have to be fetched one by one) run at once
 
         Returns:
-            List of issue dicts
+            List of issue dicts, in the order of issue_keys (missing issues are skipped)
         """
-        results = []
-        for key in issue_keys:
+        batches = [issue_keys[start:start + batch_size] for start in range(0, len(issue_keys), batch_size)]
+        # Search returns only a few fields by default; "*all" matches get_issue
+        search_fields = fields if fields else ["*all"]
+
+        def fetch_batch(batch: list) -> dict:
             try:
-                results.append(self.get_issue(key))
+                result = self.query_issues(
+                    f"key IN ({', '.join(batch)})", max_results=len(batch), fields=search_fields
+                )
+                issues = result.get("issues", [])
+            except ValueError:
+                # JQL rejects the whole search if any key doesn't exist
+                issues = []
+
+            found = {issue["key"].upper(): issue for issue in issues}
+            # get_issue follows a moved issue's old key, which JQL reports
+            # under its new one, so look up the leftovers by requested key
+            missing = [key for key in batch if key.upper() not in found]
+            for key, issue in zip(missing, self._get_issues_individually(missing, fields, max_workers)):
+                if issue is not None:
+                    found[key.upper()] = issue
+            return found
+
+        if len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+                results = list(executor.map(fetch_batch, batches))
+        else:
+            results = [fetch_batch(batch) for batch in batches]
+
+        found = {}
+        for batch_found in results:
+            found.update(batch_found)
+        return [found[key.upper()] for key in issue_keys if key.upper() in found]
+
+    def _get_issues_individually(
+        self,
+        issue_keys: list,
+        fields: Optional[list] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> list:
+        """Get issues one request per key, concurrently.
+
+        Returns:
+            List aligned with issue_keys, with None for issues that don't exist
+        """
+        if not issue_keys:
+            return []
+
+        def fetch(key: str) -> Optional[dict]:
+            try:
+                return self.get_issue(key, fields=fields)
             except ValueError:
                 # Skip issues that don't exist
-                continue
-        return results
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(issue_keys))) as executor:
+            return list(executor.map(fetch, issue_keys))
 
     def query_issues(
         self,
         jql: str,
         max_results: int = 50,
         start_at: int = 0,
-        fields: Optional[list] = None
+        fields: Optional[list] = None,
+        next_page_token: Optional[str] = None
     ) -> dict:
         """Query issues using JQL (JIRA Query Language).
 
@@ -161,7 +434,8 @@ class JiraClient:
             jql: JQL query string (e.g., "project = PROJ AND status = Open")
             max_results: Maximum number of results to return
             start_at: Starting index for pagination
-            fields: List of fields to return (default: key, summary, status, assignee, labels, issuetype, description)
+            fields: List of fields to return (default: DISPLAY_FIELDS, i.e. key, summary, status, assignee, labels, issuetype)
+            next_page_token: nextPageToken from the previous page's response
 
         Returns:
             dict with:
@@ -169,6 +443,7 @@ class JiraClient:
             - issues: List of issue dicts
             - startAt: Starting index
             - maxResults: Max results requested
+            - nextPageToken: Token for the next page (absent on the last page)
 
         Example JQL queries:
             - "project = PROJ"
@@ -176,19 +451,38 @@ class JiraClient:
             - "parent = PROJ-100"
             - "project = PROJ AND labels = backend"
         """
-        if fields is None:
-            # Default fields for display
-            fields = ["key", "summary", "status", "assignee", "labels", "issuetype", "description"]
-
         endpoint = f"/rest/api/{self.api_version}/search/jql"
         params = {
             "jql": jql,
             "maxResults": max_results,
             "startAt": start_at,
-            "fields": ",".join(fields)
+            "fields": DISPLAY_FIELDS_PARAM if fields is None else ",".join(fields)
         }
+        if next_page_token:
+            params["nextPageToken"] = next_page_token
         return self._request("GET", endpoint, params=params)
 
+    def iter_query_issues(self, jql: str, batch_size: int = SEARCH_PAGE_SIZE, fields: Optional[list] = None):
+        """Yield every issue matching a JQL query, fetching pages as they are consumed.
+
+        Args:
+            jql: JQL query string
+            batch_size: Issues requested per page
+            fields: List of fields to return (uses query_issues' default if not specified)
+
+        Yields:
+            Issue dicts, following nextPageToken until the last page
+        """
+        next_page_token = None
+        while True:
+            result = self.query_issues(
+                jql, max_results=batch_size, fields=fields, next_page_token=next_page_token
+            )
+            yield from result.get("issues", [])
+            next_page_token = result.get("nextPageToken")
+            if not next_page_token or result.get("isLast"):
+                return
+
     def update_issue(self, issue_key: str, fields: dict) -> None:
         """Update issue fields.
 
@@ -203,48 +497,58 @@ class JiraClient:
         Raises:
             ValueError: If update fails
         """
+        self.invalidate_issue(issue_key)
         endpoint = f"/rest/api/{self.api_version}/issue/{issue_key}"
         json_data = {"fields": fields}
         self._request("PUT", endpoint, json_data=json_data)
 
-    def add_label(self, issue_key: str, label: str) -> None:
+    def add_label(self, issue_key: str, label: str, current_labels: Optional[list] = None) -> None:
         """Add a label to an issue (preserving existing labels).
 
         Args:
             issue_key: Issue key like "PROJ-123"
             label: Label to add (e.g., "backend", "needs-review")
+            current_labels: The issue's labels, if the caller already has them
+                (skips fetching the issue)
 
         Raises:
             ValueError: If issue not found or update fails
         """
-        # Get current issue to fetch existing labels
-        issue = self.get_issue(issue_key)
-        current_labels = issue.get("fields", {}).get("labels", [])
+        if current_labels is None:
+            # Get current issue to fetch existing labels, bypassing the cache
+            # so the PUT can't overwrite a label someone else just changed
+            self.invalidate_issue(issue_key)
+            issue = self.get_issue(issue_key, fields=["labels"])
+            current_labels = issue.get("fields", {}).get("labels", [])
 
         # Add new label if not already present
         if label not in current_labels:
             updated_labels = current_labels + [label]
             self.update_issue(issue_key, {"labels": updated_labels})
 
-    def remove_label(self, issue_key: str, label: str) -> None:
+    def remove_label(self, issue_key: str, label: str, current_labels: Optional[list] = None) -> None:
         """Remove a label from an issue (preserving other labels).
 
         Args:
             issue_key: Issue key like "PROJ-123"
             label: Label to remove (e.g., "backend", "needs-review")
+            current_labels: The issue's labels, if the caller already has them
+                (skips fetching the issue)
 
         Raises:
             ValueError: If issue not found or update fails
         """
-        # Get current issue to fetch existing labels
-        issue = self.get_issue(issue_key)
-        current_labels = issue.get("fields", {}).get("labels", [])
+        if current_labels is None:
+            # Get current issue to fetch existing labels, bypassing the cache
+            # so the PUT can't overwrite a label someone else just changed
+            self.invalidate_issue(issue_key)
+            issue = self.get_issue(issue_key, fields=["labels"])
+            current_labels = issue.get("fields", {}).get("labels", [])
 
-        # Remove label if present
+        # Remove label if present (JIRA labels are unique per issue)
         if label in current_labels:
-            updated_labels = [
-                lbl for lbl in current_labels if lbl != label
-            ]
+            updated_labels = list(current_labels)
+            updated_labels.remove(label)
             self.update_issue(issue_key, {"labels": updated_labels})
 
     def label_roadmap_hierarchy(
@@ -279,7 +583,7 @@ class JiraClient:
             ValueError: If root issue has no valid prefix
         """
         # Validate root issue has a valid prefix
-        root_issue = self.get_issue(root_issue_key)
+        root_issue = self.get_issue(root_issue_key, fields=ROADMAP_FIELDS)
         root_summary = root_issue.get("fields", {}).get("summary", "")
         root_prefix = _extract_prefix(root_summary)
 
@@ -302,80 +606,96 @@ class JiraClient:
             'errors': 0
         }
 
-        # Traverse hierarchy
-        for item in self.get_issue_hierarchy(root_issue_key, project):
-            issue = item["issue"]
-            depth = item["depth"]
-            parent_key = item["parent_key"]
-            issue_key = issue.get("key")
-            summary = issue.get("fields", {}).get("summary", "")
-            current_labels = issue.get("fields", {}).get("labels", [])
+        # Progress lines are buffered and written to stdout in chunks
+        output = []
 
-            # Store parent relationship
-            if parent_key:
-                parent_map[issue_key] = parent_key
+        def flush_output():
+            if output:
+                sys.stdout.write("\n".join(output) + "\n")
+                sys.stdout.flush()
+                output.clear()
 
-            # Extract prefix from summary (only if matches root family)
-            prefix = _extract_prefix(summary)
-            if prefix and prefix[0] == root_family:
-                prefix_map[issue_key] = prefix
-            # If prefix doesn't match family or is missing, issue will inherit parent's labels
+        # Traverse hierarchy
+        try:
+            hierarchy = self.get_issue_hierarchy(root_issue_key, project, fields=ROADMAP_FIELDS)
+            for index, item in enumerate(hierarchy, 1):
+                if index % PROGRESS_FLUSH_EVERY == 0:
+                    flush_output()
+                issue = item["issue"]
+                depth = item["depth"]
+                parent_key = item["parent_key"]
+                issue_key = issue.get("key")
+                summary = issue.get("fields", {}).get("summary", "")
+                current_labels = issue.get("fields", {}).get("labels", [])
+
+                # Store parent relationship
+                if parent_key:
+                    parent_map[issue_key] = parent_key
+
+                # Extract prefix from summary (only if matches root family)
+                prefix = _extract_prefix(summary)
+                if prefix and prefix[0] == root_family:
+                    prefix_map[issue_key] = prefix
+                # If prefix doesn't match family or is missing, issue will inherit parent's labels
+
+                # Build ancestry labels
+                ancestry_labels = _build_ancestry_labels(
+                    issue_key, prefix_map, parent_map, label_map, depth
+                )
 
-            # Build ancestry labels
-            ancestry_labels = _build_ancestry_labels(
-                issue_key, prefix_map, parent_map, label_map, depth
-            )
+                # Store computed labels
+                label_map[issue_key] = ancestry_labels
 
-            # Store computed labels
-            label_map[issue_key] = ancestry_labels
+                # Calculate new labels to add
+                ancestry_set = set(ancestry_labels)
+                new_labels = ancestry_set.difference(current_labels)
 
-            # Calculate new labels to add
-            new_labels = set(ancestry_labels) - set(current_labels)
+                # Skip if already has correct labels
+                if not new_labels:
+                    if dry_run:
+                        output.append(f"{issue_key}: {summary[:60]}...")
+                        output.append(f"  Current labels: {current_labels}")
+                        output.append("  Already has correct labels, skipped\n")
+                    else:
+                        output.append(f"[{stats['processed'] + 1}] {issue_key}: Skipped (already has correct labels)")
+                    continue
 
-            # Skip if already has correct labels
-            if not new_labels:
+                # Preview or apply changes
                 if dry_run:
-                    print(f"{issue_key}: {summary[:60]}...")
-                    print(f"  Current labels: {current_labels}")
-                    print(f"  Already has correct labels, skipped\n")
+                    inherited_note = " (inherited)" if depth >= 4 else ""
+                    output.append(f"{issue_key}: {summary[:60]}...")
+                    output.append(f"  Current labels: {current_labels}")
+                    output.append(f"  Labels to add: {sorted(new_labels)}{inherited_note}\n")
                 else:
-                    print(f"[{stats['processed'] + 1}] {issue_key}: Skipped (already has correct labels)")
-                continue
-
-            # Preview or apply changes
-            if dry_run:
-                inherited_note = " (inherited)" if depth >= 4 else ""
-                print(f"{issue_key}: {summary[:60]}...")
-                print(f"  Current labels: {current_labels}")
-                print(f"  Labels to add: {sorted(new_labels)}{inherited_note}\n")
-            else:
-                # Apply labels
-                errors_in_issue = []
-                for label in new_labels:
+                    # Apply all new labels in one update; current_labels came with
+                    # the hierarchy item, so no re-read is needed
+                    errors_in_issue = []
                     try:
-                        self.add_label(issue_key, label)
+                        self.update_issue(issue_key, {"labels": current_labels + sorted(new_labels)})
                     except Exception as e:
                         errors_in_issue.append(str(e))
                         stats['errors'] += 1
 
-                # Print progress
-                new_count = len(new_labels)
-                existing = [lbl for lbl in current_labels if lbl in ancestry_labels]
-                existing_str = f", already had: {', '.join(existing)}" if existing else ""
-                inherited_note = ", inherited" if depth >= 4 else ""
-                error_str = f" (errors: {len(errors_in_issue)})" if errors_in_issue else ""
+                    # Print progress
+                    new_count = len(new_labels)
+                    existing = [lbl for lbl in current_labels if lbl in ancestry_set]
+                    existing_str = f", already had: {', '.join(existing)}" if existing else ""
+                    inherited_note = ", inherited" if depth >= 4 else ""
+                    error_str = f" (errors: {len(errors_in_issue)})" if errors_in_issue else ""
 
-                print(
-                    f"[{stats['processed'] + 1}] {issue_key}: "
-                    f"Added labels {sorted(new_labels)} ({new_count} new{existing_str}{inherited_note}){error_str}"
-                )
+                    output.append(
+                        f"[{stats['processed'] + 1}] {issue_key}: "
+                        f"Added labels {sorted(new_labels)} ({new_count} new{existing_str}{inherited_note}){error_str}"
+                    )
 
-            stats['processed'] += 1
-            stats['labeled'] += 1
+                stats['processed'] += 1
+                stats['labeled'] += 1
 
-            # Check limit
-            if limit and stats['labeled'] >= limit:
-                break
+                # Check limit
+                if limit and stats['labeled'] >= limit:
+                    break
+        finally:
+            flush_output()
 
         return stats
 
@@ -396,8 +716,7 @@ class JiraClient:
             List of issue dicts
         """
         jql = f"parent = {parent_key}"
-        result = self.query_issues(jql, max_results=max_results, fields=fields)
-        return result.get("issues", [])
+        return self._query_up_to(jql, max_results, fields)
 
     def query_issues_by_label(
         self,
@@ -420,8 +739,12 @@ class JiraClient:
         jql = f"labels = {label}"
         if project:
             jql = f"project = {project} AND {jql}"
-        result = self.query_issues(jql, max_results=max_results, fields=fields)
-        return result.get("issues", [])
+        return self._query_up_to(jql, max_results, fields)
+
+    def _query_up_to(self, jql: str, max_results: int, fields: Optional[list] = None) -> list:
+        """Return up to max_results matching issues, paging past the per-request limit."""
+        batch_size = min(max_results, SEARCH_PAGE_SIZE)
+        return list(itertools.islice(self.iter_query_issues(jql, batch_size, fields), max_results))
 
     def get_issue_hierarchy(
         self,
@@ -440,7 +763,7 @@ class JiraClient:
             root_issue_key: Starting issue key (e.g., "PROJ-123")
             project: Optional project key to filter by (e.g., "PROJ"). If None, traverses across all projects.
             issue_type: Optional issue type filter (e.g., "Story", "Epic")
-            max_depth: Maximum recursion depth to prevent infinite loops
+            max_depth: Maximum traversal depth to prevent infinite loops
             fields: List of fields to return (uses default if not specified)
 
         Yields:
@@ -460,7 +783,7 @@ class JiraClient:
                 print(f"{item['issue']['key']} at depth {item['depth']}")
         """
         if fields is None:
-            fields = ["key", "summary", "status", "assignee", "labels", "issuetype", "description", "issuelinks", "parent"]
+            fields = HIERARCHY_FIELDS
         else:
             # Ensure issuelinks and parent are included
             if "issuelinks" not in fields:
@@ -470,117 +793,268 @@ class JiraClient:
 
         visited = set()
         issue_cache = {}  # Cache fetched issues to avoid redundant API calls
+        # Children of each expanded issue. Issues queued for traversal wait in
+        # pending_parents so their children are fetched in one batched search
+        # with the next issue that needs its children.
+        children_map = {}
+        pending_parents = []
+        # Linked keys seen on fetched issues but not yet cached, so the next
+        # linked-issue query also prefetches links of nodes still queued
+        pending_linked = []
+        linked_type_names = {}  # Issue type names embedded in issue links
+
+        children_filter = ""
+        if project:
+            children_filter += f" AND project = {project}"
+        if issue_type:
+            children_filter += f' AND issuetype = "{issue_type}"'
+
+        def fetch_children(parent_keys: list) -> dict:
+            """Fetch the children of several issues with one paged parent IN (...) search."""
+            children = {key: [] for key in parent_keys}
+            jql = f"parent IN ({', '.join(parent_keys)}){children_filter}"
+            for child in self.iter_query_issues(jql, fields=fields):
+                parent = (child.get("fields", {}).get("parent") or {}).get("key")
+                if parent in children:
+                    children[parent].append(child)
+            return children
+
+        def linked_keys_of(issue: dict) -> list:
+            """Return keys of an issue's non-clone links within the project filter."""
+            keys = []
+            for link in issue.get("fields", {}).get("issuelinks", []):
+                # Skip clone-type links
+                if _is_clone_link(link.get("type", {})):
+                    continue
+
+                linked_issue = link.get("inwardIssue") or link.get("outwardIssue")
+                if linked_issue:
+                    linked_key = linked_issue.get("key", "")
+                    if not project or linked_key.startswith(project + "-"):
+                        keys.append(linked_key)
+                        # Links embed the linked issue's type, which lets the
+                        # issue_type filter skip fetching it at max_depth
+                        linked_type = (linked_issue.get("fields", {}).get("issuetype") or {}).get("name")
+                        if linked_type:
+                            linked_type_names[linked_key] = linked_type
+            return keys
+
+        def skip_fetch(issue_key: str, depth: int) -> bool:
+            """Check whether an issue is known to fail the type filter at max_depth.
+
+            Such an issue is never yielded and nothing below it is traversed,
+            so it doesn't need to be fetched.
+            """
+            return (
+                bool(issue_type) and depth == max_depth
+                and linked_type_names.get(issue_key, issue_type) != issue_type
+            )
+
+        def next_children_batch(batch: list) -> list:
+            """Fill a children batch with queued parents, removing them from the queue."""
+            for key in pending_parents:
+                if len(batch) >= CHILDREN_BATCH_SIZE:
+                    break
+                if key not in children_map and key not in batch:
+                    batch.append(key)
+            pending_parents[:] = [k for k in pending_parents if k not in batch and k not in children_map]
+            return batch
+
+        def store_children(fetched_children: dict) -> None:
+            """Record fetched children and queue their links for the next linked-issue query."""
+            children_map.update(fetched_children)
+            for siblings in fetched_children.values():
+                for child in siblings:
+                    pending_linked.extend(linked_keys_of(child))
 
         def fetch_issue(issue_key: str):
             """Fetch issue from cache or API."""
             if issue_key not in issue_cache:
                 try:
-                    issue_cache[issue_key] = self.get_issue(issue_key)
+                    issue_cache[issue_key] = self.get_issue(issue_key, fields=fields)
                 except ValueError:
                     issue_cache[issue_key] = None
             return issue_cache[issue_key]
 
-        def traverse(issue_key: str, depth: int, relationship: str, parent_key: Optional[str]):
-            """Recursively traverse hierarchy depth-first with batched fetching."""
-            if depth > max_depth or issue_key in visited:
-                return
-
-            visited.add(issue_key)
-
-            # Fetch the issue (from cache if available)
-            issue = fetch_issue(issue_key)
-            if issue is None:
-                return
-
-            # Filter by issue type if specified
-            should_yield = True
-            if issue_type:
-                issue_type_name = issue.get("fields", {}).get("issuetype", {}).get("name", "")
-                should_yield = (issue_type_name == issue_type)
-
-            if should_yield:
-                yield {
-                    "issue": issue,
-                    "depth": depth,
-                    "relationship": relationship,
-                    "parent_key": parent_key
-                }
-
-            # Collect all descendants (linked + children) to process in order
-            descendants = []
-
-            # Get linked issues first (they appear before children in output)
-            linked_keys = []
-            issuelinks = issue.get("fields", {}).get("issuelinks", [])
-            for link in issuelinks:
-                # Skip clone-type links
-                link_type = link.get("type", {})
-                link_type_name = link_type.get("name", "").lower()
-                link_inward = link_type.get("inward", "").lower()
-                link_outward = link_type.get("outward", "").lower()
-
-                # Check if this is a clone relationship
-                is_clone = (
-                    "clone" in link_type_name or
-                    "clone" in link_inward or
-                    "clone" in link_outward
-                )
-
-                if is_clone:
-                    continue  # Skip clone links
-
-                linked_issue = link.get("inwardIssue") or link.get("outwardIssue")
-                if linked_issue:
-                    linked_key = linked_issue.get("key", "")
-                    should_include = linked_key not in visited
-                    if project:
-                        should_include = should_include and linked_key.startswith(project + "-")
-                    if should_include:
-                        descendants.append((linked_key, "linked"))
-                        linked_keys.append(linked_key)
-
-            # Batch fetch linked issues that aren't cached
-            uncached_linked = [k for k in linked_keys if k not in issue_cache]
-            if uncached_linked:
-                try:
-                    if len(uncached_linked) == 1:
-                        linked_jql = f"key = {uncached_linked[0]}"
+        # Depth-first traversal with an explicit stack; descendants are pushed
+        # in reverse so they are visited in order
+        stack = [(root_issue_key, 0, "root", None)]
+        # (parent keys, future) of a children search started ahead of need
+        prefetch = None
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            while stack:
+                issue_key, depth, relationship, parent_key = stack.pop()
+                if depth > max_depth or issue_key in visited:
+                    continue
+
+                visited.add(issue_key)
+                if skip_fetch(issue_key, depth):
+                    continue
+
+                # Fetch the issue (from cache if available)
+                issue = fetch_issue(issue_key)
+                if issue is None:
+                    continue
+
+                # Filter by issue type if specified
+                should_yield = True
+                if issue_type:
+                    issue_type_name = issue.get("fields", {}).get("issuetype", {}).get("name", "")
+                    should_yield = (issue_type_name == issue_type)
+
+                if should_yield:
+                    yield {
+                        "issue": issue,
+                        "depth": depth,
+                        "relationship": relationship,
+                        "parent_key": parent_key
+                    }
+
+                # Collect all descendants (linked + children) to process in order
+                descendants = []
+
+                # Get linked issues first (they appear before children in output);
+                # links past max_depth would never be traversed
+                linked_keys = []
+                if depth < max_depth:
+                    linked_keys = [k for k in linked_keys_of(issue) if k not in visited]
+                descendants.extend((k, "linked") for k in linked_keys)
+
+                # The batch fetch of uncached linked issues and the child query
+                # are independent, so both searches run concurrently
+                linked_future = None
+                uncached_linked = [
+                    k for k in linked_keys if k not in issue_cache and not skip_fetch(k, depth + 1)
+                ]
+                if uncached_linked:
+                    batch = list(dict.fromkeys(uncached_linked))
+                    for key in pending_linked:
+                        if len(batch) >= BULK_BATCH_SIZE:
+                            break
+                        if key not in issue_cache and key not in visited and key not in batch:
+                            batch.append(key)
+                    pending_linked[:] = [
+                        k for k in pending_linked if k not in batch and k not in issue_cache and k not in visited
+                    ]
+                    if len(batch) == 1:
+                        linked_jql = f"key = {batch[0]}"
                     else:
-                        keys_str = ", ".join(uncached_linked)
+                        keys_str = ", ".join(batch)
                         linked_jql = f"key IN ({keys_str})"
+                    linked_future = executor.submit(
+                        self.query_issues, linked_jql, max_results=len(batch), fields=fields
+                    )
+
+                # Subtasks can't have children, so they never need the search
+                if _is_subtask(issue):
+                    children_map.setdefault(issue_key, [])
+
+                # Use the prefetched children search if it covers this issue;
+                # if it failed, the issue falls back to its own search below
+                if prefetch is not None and issue_key in prefetch[0]:
+                    prefetch_future = prefetch[1]
+                    prefetch = None
+                    try:
+                        store_children(prefetch_future.result())
+                    except Exception:
+                        pass
 
-                    linked_result = self.query_issues(linked_jql, max_results=len(uncached_linked), fields=fields)
-                    for linked_issue in linked_result.get("issues", []):
-                        issue_cache[linked_issue["key"]] = linked_issue
-                except Exception:
-                    pass
+                # Children past max_depth would never be traversed, so skip the search
+                children_future = None
+                if depth < max_depth and issue_key not in children_map:
+                    children_future = executor.submit(fetch_children, next_children_batch([issue_key]))
 
-            # Query for child issues (this caches them automatically)
-            children_jql = f"parent = {issue_key}"
-            if project:
-                children_jql += f" AND project = {project}"
-            if issue_type:
-                children_jql += f' AND issuetype = "{issue_type}"'
+                if linked_future is not None:
+                    try:
+                        for linked_issue in linked_future.result().get("issues", []):
+                            issue_cache[linked_issue["key"]] = linked_issue
+                            pending_linked.extend(linked_keys_of(linked_issue))
+                    except Exception:
+                        pass
 
-            try:
-                children_result = self.query_issues(children_jql, max_results=100, fields=fields)
-                children_issues = children_result.get("issues", [])
+                if children_future is not None:
+                    try:
+                        fetched_children = children_future.result()
+                    except Exception:
+                        children_map[issue_key] = []
+                    else:
+                        store_children(fetched_children)
 
-                for child in children_issues:
+                for child in children_map.get(issue_key, []):
                     child_key = child.get("key")
                     if child_key and child_key not in visited:
                         # Cache the child issue
                         issue_cache[child_key] = child
                         descendants.append((child_key, "child"))
-            except Exception:
-                pass
 
-            # Recursively traverse each descendant in order (depth-first)
-            for desc_key, desc_relationship in descendants:
-                yield from traverse(desc_key, depth + 1, desc_relationship, issue_key)
+                # Queue descendants whose children will be needed
+                if depth + 1 < max_depth:
+                    for desc_key, _ in descendants:
+                        if _is_subtask(issue_cache.get(desc_key)):
+                            children_map[desc_key] = []
+                        else:
+                            pending_parents.append(desc_key)
+
+                stack.extend(
+                    (desc_key, depth + 1, desc_relationship, issue_key)
+                    for desc_key, desc_relationship in reversed(descendants)
+                )
+
+                # Start the next issue's children search (batched with queued
+                # parents as usual) in the background, so it runs while the
+                # caller handles the items yielded before it is needed
+                if prefetch is None and stack:
+                    next_key, next_depth = stack[-1][:2]
+                    if next_depth < max_depth and next_key not in visited and next_key not in children_map:
+                        batch = next_children_batch([next_key])
+                        prefetch = (batch, executor.submit(fetch_children, batch))
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff delay with jitter for a zero-based retry attempt."""
+    return min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * 2 ** attempt) + random.uniform(0, 1)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def _is_retryable_status(method: str, status: int, retry_after: Optional[float]) -> bool:
+    """Check whether a response status may be retried for this method."""
+    if status not in RETRY_STATUSES:
+        return False
+    if method in IDEMPOTENT_METHODS or status == 429:
+        return True
+    return status == 503 and retry_after is not None
+
 
-        # Start traversal from root
-        yield from traverse(root_issue_key, 0, "root", None)
+def _encode_json_body(data) -> bytes:
+    """Encode a request body as compact UTF-8 JSON."""
+    return _JSON_BODY_ENCODER.encode(data).encode("utf-8")
+
+
+def _is_subtask(issue: Optional[dict]) -> bool:
+    """Check whether an issue's type is a subtask type (which has no children)."""
+    if not issue:
+        return False
+    issue_type = issue.get("fields", {}).get("issuetype") or {}
+    return bool(issue_type.get("subtask"))
+
+
+def _is_clone_link(link_type: dict) -> bool:
+    """Check whether an issue link type is a clone relationship."""
+    name = link_type.get("name", "")
+    if name in CLONE_LINK_TYPE_NAMES:
+        return True
+    return any(
+        "clone" in text.lower()
+        for text in (name, link_type.get("inward", ""), link_type.get("outward", ""))
+    )
 
 
 def _format_issue(issue: dict) -> str:
@@ -688,8 +1162,7 @@ def _extract_prefix(summary: str) -> Optional[str]:
     Returns:
         Extracted prefix string or None if no valid prefix found
     """
-    import re
-    match = re.match(r'^([A-Z]\d+(?:\.\d+)*)\s*\.?\s*', summary)
+    match = ROADMAP_PREFIX_RE.match(summary)
     return match.group(1) if match else None
 
 
@@ -707,6 +1180,11 @@ def _build_ancestry_labels(
     - Depth 3: Return root + parent + self (3 labels max)
     - Depth 4+: Inherit parent's labels
 
+    Labels are built from the parent's entry in label_map rather than by
+    walking up to the root. Truncating to root + parent + self keeps the root
+    and the last two prefixes, so truncating the parent's labels plus this
+    issue's prefix gives the same result as truncating the full chain.
+
     Args:
         issue_key: Current issue key
         prefix_map: Dictionary mapping issue_key → prefix
@@ -717,27 +1195,18 @@ def _build_ancestry_labels(
     Returns:
         List of lowercase label strings (e.g., ['c1', 'c1.5', 'c1.5.1'])
     """
+    parent_key = parent_map.get(issue_key)
+    parent_labels = label_map.get(parent_key, []) if parent_key else []
+
     # For depth >= 4, inherit parent's labels
-    if depth >= 4:
-        parent_key = parent_map.get(issue_key)
-        if parent_key and parent_key in label_map:
-            return label_map[parent_key]  # Inherit parent's labels
-        # Fallback: try to build from ancestry
-
-    # Collect full ancestry chain from issue to root
-    ancestry = []
-    current_key = issue_key
-
-    while current_key:
-        if current_key in prefix_map:
-            ancestry.append(prefix_map[current_key].lower())
-        if current_key in parent_map:
-            current_key = parent_map[current_key]
-        else:
-            break
+    if depth >= 4 and parent_key in label_map:
+        return parent_labels
 
-    # Reverse to get root → ... → self order
-    ancestry = list(reversed(ancestry))
+    # Extend the parent's chain (root → ... → parent) with this issue's prefix
+    if issue_key in prefix_map:
+        ancestry = parent_labels + [prefix_map[issue_key].lower()]
+    else:
+        ancestry = parent_labels
 
     # Apply depth-based strategy
     if len(ancestry) > 3:
@@ -777,6 +1246,7 @@ def main():
         print("  label-roadmap <root-issue> [project] [--dry-run] [--limit N]")
         sys.exit(1)
 
+    client = None
     try:
         start_time = time.time()
 
@@ -794,7 +1264,8 @@ def main():
             _print_issue_details(issue)
 
         elif command == "get-issues-bulk":
-            issues = client.get_issues_bulk(sys.argv[2:])
+            # The one-line format only reads the display fields
+            issues = client.get_issues_bulk(sys.argv[2:], fields=DISPLAY_FIELDS)
             for issue in issues:
                 print(_format_issue(issue))
 
@@ -913,6 +1384,9 @@ def main():
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        if client is not None:
+            client.close()
 
 
 if __name__ == "__main__":
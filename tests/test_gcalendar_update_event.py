@@ -0,0 +1,53 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from sidekick.clients.gcalendar import GCalendarClient
+
+
+class UpdateEventTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = GCalendarClient("client-id", "client-secret", "refresh-token", token_cache_path=None)
+
+    def patch_body(self, **kwargs) -> dict:
+        with mock.patch.object(self.client, "_request", return_value={}) as request:
+            self.client.update_event("event-1", **kwargs)
+        method, _url = request.call_args.args
+        self.assertEqual(method, "PATCH")
+        return request.call_args.kwargs["json_data"]
+
+    def test_switch_timed_event_to_all_day_clears_date_time(self) -> None:
+        body = self.patch_body(start_time="2026-06-25", end_time="2026-06-26")
+
+        self.assertEqual(body["start"], {"date": "2026-06-25", "dateTime": None, "timeZone": None})
+        self.assertEqual(body["end"], {"date": "2026-06-26", "dateTime": None, "timeZone": None})
+
+    def test_switch_all_day_event_to_timed_clears_date(self) -> None:
+        body = self.patch_body(
+            start_time="2026-06-25T09:00:00-07:00",
+            end_time="2026-06-25T10:00:00-07:00",
+            tz="America/Los_Angeles",
+        )
+
+        self.assertEqual(
+            body["start"],
+            {"date": None, "dateTime": "2026-06-25T09:00:00-07:00", "timeZone": "America/Los_Angeles"},
+        )
+        self.assertEqual(
+            body["end"],
+            {"date": None, "dateTime": "2026-06-25T10:00:00-07:00", "timeZone": "America/Los_Angeles"},
+        )
+
+    def test_untouched_times_are_not_sent(self) -> None:
+        body = self.patch_body(summary="Renamed")
+
+        self.assertEqual(body, {"summary": "Renamed"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -826,11 +826,9 @@ def search_all_messages(client: GmailClient, query: str) -> List[dict]:
         result = client._request("GET", "/users/me/messages", params=params)
         page_messages = result.get("messages", [])
 
-        for message in page_messages:
-            try:
-                messages.append(client.get_message(message["id"]))
-            except Exception:
-                messages.append(message)
+        details = client.get_messages([message["id"] for message in page_messages])
+        for message, detail in zip(page_messages, details):
+            messages.append(message if "error" in detail else detail)
 
         next_page_token = result.get("nextPageToken")
         if not next_page_token:
@@ -1006,6 +1004,8 @@ def main(argv: Optional[List[str]] = None):
     except Exception as e:
         log(f"Fatal error: {e}")
         sys.exit(1)
+    finally:
+        client.close()
 
 
 if __name__ == "__main__":
@@ -499,13 +499,16 @@ def main(argv: Optional[List[str]] = None) -> int:
     buffer = timedelta(minutes=args.miclog_buffer_minutes)
 
     client = load_calendar_client()
-    events = load_candidate_events(
-        client=client,
-        calendar_id=args.calendar_id,
-        now=now,
-        ended_window=ended_window,
-        ending_window=ending_window,
-    )
+    try:
+        events = load_candidate_events(
+            client=client,
+            calendar_id=args.calendar_id,
+            now=now,
+            ended_window=ended_window,
+            ending_window=ending_window,
+        )
+    finally:
+        client.close()
     log(f"Found {len(events)} eligible calendar event(s)")
 
     selected = select_event_with_miclog(
@@ -207,11 +207,14 @@ def main():
         )
 
         # List events for next business day
-        events = client.list_events(
-            time_min=start_time,
-            time_max=end_time,
-            max_results=50
-        )
+        try:
+            events = client.list_events(
+                time_min=start_time,
+                time_max=end_time,
+                max_results=50
+            )
+        finally:
+            client.close()
 
         if not events:
             print(f"No events found for {weekday_name}")